@@ -19,6 +19,7 @@ from typing import Dict, List, Any, Optional, Union
 
 from intellicenter.core.event_bus import EventBus
 from intellicenter.scenarios.scenario_orchestrator import ScenarioOrchestrator, ScenarioType
+from intellicenter.shared import event_loop
 from dev_tools.demo_fallback import FallbackDemoRunner, WebSocketServerManager
 
 
@@ -475,4 +476,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    event_loop.run(main())
\ No newline at end of file
@@ -112,7 +112,7 @@ class AsyncCrewAI:
     async def _cleanup_memory(self):
         """Perform memory cleanup using MemoryOptimizer"""
         cleanup_count = self.memory_optimizer.cleanup_memory(force=True)
-        await asyncio.sleep(0.1)  # Allow cleanup to complete
+        await asyncio.sleep(0)  # cleanup_memory is synchronous; just yield to the loop
         return cleanup_count
         
     def get_stats(self) -> Dict[str, Any]:
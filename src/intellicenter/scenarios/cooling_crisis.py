@@ -88,13 +88,6 @@ class CoolingCrisisScenario:
     
     def _setup_event_subscriptions(self):
         """Setup event bus subscriptions for cooling crisis monitoring"""
-        # Subscribe to temperature events
-        self.event_bus.subscribe(
-            "hvac.temperature.changed", 
-            self._handle_temperature_event
-        )
-        
-        # Subscribe to agent responses
         agent_events = [
             "hvac.cooling.decision",
             "power.optimization.decision",
@@ -102,8 +95,12 @@ class CoolingCrisisScenario:
             "facility.coordination.directive"
         ]
         
-        for event_type in agent_events:
-            self.event_bus.subscribe(event_type, self._handle_agent_response)
+        self.event_bus.subscribe_many({
+            # Temperature events
+            "hvac.temperature.changed": self._handle_temperature_event,
+            # Agent responses
+            **dict.fromkeys(agent_events, self._handle_agent_response)
+        })
     
     async def _handle_temperature_event(self, message: str):
         """Handle incoming temperature events and trigger crisis if threshold exceeded"""
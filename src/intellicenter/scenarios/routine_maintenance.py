@@ -14,10 +14,13 @@ Features:
 """
 
 import asyncio
-import json
 import time
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Callable
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Callable, Tuple
 
 from intellicenter.shared.event_bus import EventBus
 from intellicenter.shared.logger import logger
@@ -29,10 +32,133 @@ from intellicenter.shared.schema import (
     ScenarioStepRuntime,
     ScenarioType,
 )
+from intellicenter.shared.serialization import JSONDecodeError, dumps, loads
 
 
 # Removed local Enum and dataclass definitions as they are now in shared.schema
 
+# Bound once: the bind key is constant for every instance
+_scenario_logger = logger.bind(scenario="routine_maintenance")
+
+_SCENARIO_ID = "routine_maintenance_demo"
+
+INGRESS_QUEUE_SIZE = 1024  # Agent events buffered ahead of the ingress worker
+MAX_MAINTENANCE_EVENTS = 2048  # Coordination events retained per run (oldest dropped first)
+
+# Step definitions built once at import; _create_maintenance_steps deep-copies them into
+# per-run runtimes, since ScenarioStepRuntime fields are written while a run executes.
+# In this scenario delay_seconds is a minimum step duration, not a delay before execution:
+# the step event is published as the step starts and the delay runs alongside the response
+# wait (see _execute_step), so a step lasts max(delay, response latency).
+_STEP_TEMPLATES: Tuple[ScenarioStepRuntime, ...] = (
+    ScenarioStepRuntime(
+        step_id="maintenance_detection",
+        description="Detect scheduled maintenance window",
+        event_type="demo.scenario.start",
+        event_data={"scenario": "routine_maintenance", "phase": "detection"},
+        delay_seconds=1.0
+    ),
+    ScenarioStepRuntime(
+        step_id="hvac_system_check",
+        description="Perform HVAC system status check",
+        event_type="hvac.system.status",
+        event_data={"system": "hvac", "status": "check", "location": "server_room_main"},
+        delay_seconds=5.0,
+        timeout_seconds=15.0,
+        expected_responses=["hvac.system.status"],
+        required_agents=[AgentType.HVAC]
+    ),
+    ScenarioStepRuntime(
+        step_id="network_connectivity_check",
+        description="Validate network connectivity and performance",
+        event_type="network.connectivity.status",
+        event_data={"system": "network", "status": "validation", "location": "server_room_main"},
+        delay_seconds=5.0,
+        timeout_seconds=15.0,
+        expected_responses=["network.connectivity.status"],
+        required_agents=[AgentType.NETWORK]
+    ),
+    ScenarioStepRuntime(
+        step_id="coordination_completion",
+        description="Complete coordination and verification",
+        event_type="facility.maintenance.completion",
+        event_data={"scenario_complete": True, "location": "server_room_main"},
+        delay_seconds=3.0,
+        timeout_seconds=15.0,
+        expected_responses=["facility.maintenance.completion"],
+        required_agents=[AgentType.COORDINATOR]
+    )
+)
+
+# Serialized template step payloads up to the timestamp value, with the event_data they were
+# built from; only the timestamp changes per publish
+_STEP_PAYLOAD_HEADS: Mapping[str, Tuple[Dict[str, Any], str]] = MappingProxyType({
+    step.step_id: (step.event_data, dumps({
+        **step.event_data,
+        "scenario_id": _SCENARIO_ID,
+        "step_id": step.step_id
+    })[:-1] + ',"timestamp":"')
+    for step in _STEP_TEMPLATES
+})
+
+# Phase entered once each step completes
+_STEP_PHASES = {
+    "maintenance_detection": MaintenancePhase.DETECTION,
+    "hvac_system_check": MaintenancePhase.HVAC_CHECK,
+    "network_connectivity_check": MaintenancePhase.NETWORK_CHECK,
+    "coordination_completion": MaintenancePhase.COMPLETION
+}
+
+# Agent response events the scenario listens to
+_MAINT_EVENTS = (
+    "hvac.system.status",
+    "network.connectivity.status",
+    "facility.maintenance.response",
+    "facility.maintenance.completion"
+)
+
+# (payload keyword, event-type keyword, agent type) in precedence order
+_AGENT_KEYWORDS = (
+    ("hvac", "hvac", str(AgentType.HVAC)),
+    ("network", "network", str(AgentType.NETWORK)),
+    ("coordinator", "facility.maintenance", str(AgentType.COORDINATOR)),
+    ("power", "power", str(AgentType.POWER)),
+    ("security", "security", str(AgentType.SECURITY)),
+)
+
+
+def _event_type_agent(event_type: str) -> Tuple[Tuple[Tuple[str, str, str], ...], Optional[str]]:
+    """
+    Resolve the agent type implied by an event type.
+
+    Returns the higher-precedence keywords that may still override it from
+    the payload, and the implied agent type (None if the event implies none).
+    """
+    for rank, (_, event_keyword, agent_type) in enumerate(_AGENT_KEYWORDS):
+        if event_keyword in event_type:
+            return _AGENT_KEYWORDS[:rank], agent_type
+    return _AGENT_KEYWORDS, None
+
+
+@dataclass(slots=True)
+class _MaintenanceResponse:
+    """Agent response recorded during a maintenance run"""
+    received_at: datetime
+    timestamp: float
+    event_type: str
+    agent_type: str
+    data: Dict[str, Any]
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Flatten into the dict shape stored on ScenarioResult"""
+        return {
+            **self.data,
+            "received_at": self.received_at,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "agent_type": self.agent_type
+        }
+
 
 class RoutineMaintenanceScenario:
     """
@@ -44,19 +170,32 @@ class RoutineMaintenanceScenario:
     
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
-        self.logger = logger.bind(scenario="routine_maintenance")
+        self.logger = _scenario_logger
+        self._scenario_id = _SCENARIO_ID
         
         # Scenario state management
         self.current_phase = MaintenancePhase.DETECTION
+        self._current_phase_str = self.current_phase.value  # kept in sync by _set_phase
         self.maintenance_steps: List[MaintenanceStep] = []
         self.maintenance_result: Optional[MaintenanceResult] = None
         
         # Execution tracking
         self.start_time: Optional[datetime] = None
+        self._start_monotonic: Optional[float] = None  # elapsed-time arithmetic
         self.current_step_index: int = 0
         self.step_start_time: Optional[datetime] = None
-        self.agent_responses: Dict[str, List[Dict[str, Any]]] = {}
-        self.maintenance_events: List[Dict[str, Any]] = []
+        self.agent_responses: Dict[str, Deque[_MaintenanceResponse]] = {}
+        # Running response totals for get_performance_metrics
+        self._total_responses = 0
+        self._per_agent_counts: Dict[str, int] = defaultdict(int)
+        # Per-agent response counts when the current step started
+        self._step_start_counts: Dict[str, int] = {}
+        self.maintenance_events: Deque[Dict[str, Any]] = deque(maxlen=MAX_MAINTENANCE_EVENTS)
+        # Set by event handlers whenever a response is stored; wakes step waiters
+        self._response_event = asyncio.Event()
+        # Raw agent events queued by the bus handlers; parsed and stored by the ingress worker
+        self._ingress: asyncio.Queue = asyncio.Queue(maxsize=INGRESS_QUEUE_SIZE)
+        self._ingress_task: Optional[asyncio.Task] = None
         
         # Event handlers and subscriptions
         self.event_handlers: Dict[str, Callable] = {}
@@ -64,7 +203,14 @@ class RoutineMaintenanceScenario:
         
         # Timing constraints
         self.max_duration_seconds = 60.0  # 1 minute max for quick demo
-        self.step_timeout_task: Optional[asyncio.Task] = None
+        
+        # Subscriptions outlive resets (the bus has no unsubscribe), so integration happens once
+        self._orchestrator_integrated = False
+        
+        # True while start_maintenance is running; duplicate start events are ignored
+        self._maintenance_running = False
+        # Run started from an orchestrator start event (strong ref so it isn't GC'd)
+        self._maintenance_task: Optional[asyncio.Task] = None
         
         # Initialize maintenance steps
         self._create_maintenance_steps()
@@ -74,124 +220,113 @@ class RoutineMaintenanceScenario:
     
     def _create_maintenance_steps(self):
         """Create routine maintenance steps"""
-        self.maintenance_steps = [
-            ScenarioStepRuntime(
-                step_id="maintenance_detection",
-                description="Detect scheduled maintenance window",
-                event_type="demo.scenario.start",
-                event_data={"scenario": "routine_maintenance", "phase": "detection"},
-                delay_seconds=1.0
-            ),
-            ScenarioStepRuntime(
-                step_id="hvac_system_check",
-                description="Perform HVAC system status check",
-                event_type="hvac.system.status",
-                event_data={"system": "hvac", "status": "check", "location": "server_room_main"},
-                delay_seconds=5.0,
-                timeout_seconds=15.0,
-                expected_responses=["hvac.system.status"],
-                required_agents=[AgentType.HVAC]
-            ),
-            ScenarioStepRuntime(
-                step_id="network_connectivity_check",
-                description="Validate network connectivity and performance",
-                event_type="network.connectivity.status",
-                event_data={"system": "network", "status": "validation", "location": "server_room_main"},
-                delay_seconds=5.0,
-                timeout_seconds=15.0,
-                expected_responses=["network.connectivity.status"],
-                required_agents=[AgentType.NETWORK]
-            ),
-            ScenarioStepRuntime(
-                step_id="coordination_completion",
-                description="Complete coordination and verification",
-                event_type="facility.maintenance.completion",
-                event_data={"scenario_complete": True, "location": "server_room_main"},
-                delay_seconds=3.0,
-                timeout_seconds=15.0,
-                expected_responses=["facility.maintenance.completion"],
-                required_agents=[AgentType.COORDINATOR]
-            )
-        ]
+        self.maintenance_steps = [step.model_copy(deep=True) for step in _STEP_TEMPLATES]
+    
+    def _set_phase(self, phase: MaintenancePhase):
+        """Switch phase and refresh the cached phase string"""
+        self.current_phase = phase
+        self._current_phase_str = phase.value
     
     def _setup_event_subscriptions(self):
         """Setup event subscriptions for routine maintenance"""
         # Subscribe to maintenance-related events
-        maintenance_events = [
-            "hvac.system.status",
-            "network.connectivity.status",
-            "facility.maintenance.response",
-            "facility.maintenance.completion"
-        ]
-        
-        for event_type in maintenance_events:
-            handler = self._create_event_handler(event_type)
-            self.event_bus.subscribe(event_type, handler)
-            self.event_handlers[event_type] = handler
-            self.active_subscriptions.append(event_type)
+        handlers = {
+            event_type: self._create_event_handler(event_type)
+            for event_type in _MAINT_EVENTS
+            if event_type not in self.event_handlers
+        }
+        self.event_bus.subscribe_many(handlers)
+        self.event_handlers.update(handlers)
+        self.active_subscriptions.extend(handlers)
     
     def _create_event_handler(self, event_type: str) -> Callable:
         """Create an event handler for a specific event type"""
+        # The event type never changes for this handler, so resolve its agent once
+        payload_keywords, event_agent = _event_type_agent(event_type)
+        
         async def handler(message: str):
-            try:
-                # Parse message
-                if isinstance(message, str):
-                    try:
-                        data = json.loads(message)
-                    except json.JSONDecodeError:
-                        data = {"raw_message": message}
-                else:
-                    data = message
-                
-                # Extract agent type from event
-                agent_type = self._extract_agent_type(event_type, data)
-                
-                # Store response with timestamp
-                response_record = {
-                    **data,
-                    "received_at": datetime.now(timezone.utc),
-                    "timestamp": time.time(),
-                    "event_type": event_type,
-                    "agent_type": agent_type
-                }
-                
-                if agent_type not in self.agent_responses:
-                    self.agent_responses[agent_type] = []
-                
-                self.agent_responses[agent_type].append(response_record)
-                
-                # Log coordination event
-                self.maintenance_events.append({
-                    "type": "agent_response",
-                    "agent_type": agent_type,
-                    "timestamp": datetime.now(timezone.utc),
-                    "phase": self.current_phase.value,
-                    "data": data
-                })
-                
-                self.logger.debug(f"📨 Agent response received: {agent_type} for {self.current_phase.value}")
-                
-            except Exception as e:
-                self.logger.error(f"Error handling event {event_type}: {e}")
+            # Hand off to the ingress worker so the bus dispatch loop isn't held up by parsing
+            if self._ingress_task is None or self._ingress_task.done():
+                self._ingress_task = asyncio.create_task(self._ingress_worker())
+            await self._ingress.put((event_type, payload_keywords, event_agent, message))
         
         return handler
     
-    def _extract_agent_type(self, event_type: str, data: Dict[str, Any]) -> str:
-        """Extract and normalize agent type from event type or data"""
+    async def _ingress_worker(self):
+        """Parse and store queued agent events in arrival order"""
+        while True:
+            event_type, payload_keywords, event_agent, message = await self._ingress.get()
+            try:
+                self._store_agent_response(event_type, payload_keywords, event_agent, message)
+            finally:
+                self._ingress.task_done()
+    
+    def _store_agent_response(
+        self,
+        event_type: str,
+        payload_keywords: Tuple[Tuple[str, str, str], ...],
+        event_agent: Optional[str],
+        message: str,
+    ):
+        """Parse an agent event and record it as a response"""
+        try:
+            # Parse message
+            if isinstance(message, str):
+                try:
+                    data = loads(message)
+                except JSONDecodeError:
+                    data = {"raw_message": message}
+            else:
+                data = message
+            
+            # Extract agent type from event
+            agent_type = self._extract_agent_type(data, payload_keywords, event_agent)
+            
+            # Store response with timestamp
+            now = datetime.now(timezone.utc)
+            response_record = _MaintenanceResponse(now, now.timestamp(), event_type, agent_type, data)
+            
+            if agent_type not in self.agent_responses:
+                self.agent_responses[agent_type] = deque()
+            
+            self.agent_responses[agent_type].append(response_record)
+            self._total_responses += 1
+            self._per_agent_counts[agent_type] += 1
+            self._response_event.set()
+            
+            # Log coordination event
+            self.maintenance_events.append({
+                "type": "agent_response",
+                "agent_type": agent_type,
+                "timestamp": now,
+                "phase": self._current_phase_str,
+                "data": data
+            })
+            
+            # Structured fields: nothing is formatted when debug logging is filtered out
+            self.logger.debug("📨 Agent response received", agent_type=agent_type, phase=self._current_phase_str)
+            
+        except Exception as e:
+            self.logger.error(f"Error handling event {event_type}: {e}")
+    
+    def _extract_agent_type(
+        self,
+        data: Dict[str, Any],
+        payload_keywords: Tuple[Tuple[str, str, str], ...],
+        event_agent: Optional[str],
+    ) -> str:
+        """Extract and normalize agent type from event data or the event's implied agent"""
         # Try to get from data first
         raw_agent_type = data.get("agent_type", "")
         
-        # Determine base agent type
-        if "hvac" in raw_agent_type or "hvac" in event_type:
-            return str(AgentType.HVAC)
-        elif "network" in raw_agent_type or "network" in event_type:
-            return str(AgentType.NETWORK)
-        elif "coordinator" in raw_agent_type or "facility.maintenance" in event_type:
-            return str(AgentType.COORDINATOR)
-        elif "power" in raw_agent_type or "power" in event_type:
-            return str(AgentType.POWER)
-        elif "security" in raw_agent_type or "security" in event_type:
-            return str(AgentType.SECURITY)
+        # Payload keywords only win if they outrank the event-type match
+        if raw_agent_type:
+            for keyword, _, agent_type in payload_keywords:
+                if keyword in raw_agent_type:
+                    return agent_type
+        
+        if event_agent is not None:
+            return event_agent
         
         return raw_agent_type or "unknown_agent"
     
@@ -202,6 +337,7 @@ class RoutineMaintenanceScenario:
         Returns:
             MaintenanceResult containing execution results
         """
+        self._maintenance_running = True
         try:
             self.logger.info("🔧 Starting routine maintenance scenario")
             
@@ -217,12 +353,13 @@ class RoutineMaintenanceScenario:
             self.logger.error(f"Error starting routine maintenance: {e}")
             
             # Create error result
+            now = datetime.now(timezone.utc)
             error_result = ScenarioResult(
                 scenario_id="routine_maintenance_error",
                 scenario_type=ScenarioType.ROUTINE_MAINTENANCE,
                 state=ScenarioState.FAILED,
-                start_time=datetime.now(timezone.utc),
-                end_time=datetime.now(timezone.utc),
+                start_time=now,
+                end_time=now,
                 success=False,
                 error_message=str(e),
                 steps_total=0
@@ -230,23 +367,29 @@ class RoutineMaintenanceScenario:
             
             self.maintenance_result = error_result
             return error_result
+        
+        finally:
+            self._maintenance_running = False
     
     async def _initialize_maintenance(self):
         """Initialize routine maintenance for execution"""
         self.logger.info("Initializing routine maintenance scenario")
         
         # Set initial phase
-        self.current_phase = MaintenancePhase.DETECTION
+        self._set_phase(MaintenancePhase.DETECTION)
         self.start_time = datetime.now(timezone.utc)
+        self._start_monotonic = time.monotonic()
         self.current_step_index = 0
         
         # Reset tracking data
         self.agent_responses.clear()
+        self._total_responses = 0
+        self._per_agent_counts.clear()
         self.maintenance_events.clear()
         
         # Initialize result tracking
         self.maintenance_result = ScenarioResult(
-            scenario_id="routine_maintenance_demo",
+            scenario_id=self._scenario_id,
             scenario_type=ScenarioType.ROUTINE_MAINTENANCE,
             state=ScenarioState.INITIALIZING,
             start_time=self.start_time,
@@ -254,14 +397,10 @@ class RoutineMaintenanceScenario:
         )
         
         # Publish start event
-        await self.event_bus.publish(
+        await self._publish_lifecycle(
             "demo.scenario.initialized",
-            json.dumps({
-                "scenario_id": "routine_maintenance_demo",
-                "scenario_type": "routine_maintenance",
-                "name": "Routine Maintenance",
-                "timestamp": self.start_time.isoformat()
-            })
+            {"scenario_type": "routine_maintenance", "name": "Routine Maintenance"},
+            self.start_time
         )
         
         self.logger.info("✅ Routine maintenance scenario initialized")
@@ -277,11 +416,12 @@ class RoutineMaintenanceScenario:
             # Initialize start_time if not set (for direct calls from tests)
             if not self.start_time:
                 self.start_time = datetime.now(timezone.utc)
+                self._start_monotonic = time.monotonic()
             
             # Initialize maintenance result if not already set
             if not self.maintenance_result:
                 self.maintenance_result = ScenarioResult(
-                    scenario_id="routine_maintenance_demo",
+                    scenario_id=self._scenario_id,
                     scenario_type=ScenarioType.ROUTINE_MAINTENANCE,
                     state=ScenarioState.RUNNING,
                     start_time=self.start_time,
@@ -313,10 +453,9 @@ class RoutineMaintenanceScenario:
                     
                     # Update current phase (mock phase update since ScenarioStep doesn't have it directly)
                     # We can infer it from step_id for this specific scenario
-                    if "detection" in step.step_id: self.current_phase = MaintenancePhase.DETECTION
-                    elif "hvac" in step.step_id: self.current_phase = MaintenancePhase.HVAC_CHECK
-                    elif "network" in step.step_id: self.current_phase = MaintenancePhase.NETWORK_CHECK
-                    elif "completion" in step.step_id: self.current_phase = MaintenancePhase.COMPLETION
+                    phase = _STEP_PHASES.get(step.step_id)
+                    if phase is not None:
+                        self._set_phase(phase)
             
             # Evaluate maintenance success
             success = await self._evaluate_maintenance_success()
@@ -335,40 +474,23 @@ class RoutineMaintenanceScenario:
         """Execute a single maintenance step"""
         self.logger.info(f"🔄 Executing step: {step.step_id} - {step.description}")
         
+        # Let the ingress worker store everything already received, so earlier responses
+        # are not credited to this step; responses stored from here on belong to it
+        await self._ingress.join()
+        self._step_start_counts = {
+            agent: len(responses) for agent, responses in self.agent_responses.items()
+        }
+        
         try:
-            # Apply delay if specified
+            # delay_seconds is a minimum step duration here: publish now, and let the delay
+            # run alongside the response wait
             if step.delay_seconds > 0:
-                await asyncio.sleep(step.delay_seconds)
-            
-            # Setup step timeout
-            if self.step_timeout_task:
-                self.step_timeout_task.cancel()
-            
-            self.step_timeout_task = asyncio.create_task(
-                self._step_timeout_handler(step.timeout_seconds, step.step_id)
-            )
-            
-            # Publish step event
-            event_data = step.event_data.copy()
-            event_data.update({
-                "scenario_id": "routine_maintenance_demo",
-                "step_id": step.step_id,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
-            
-            await self.event_bus.publish(step.event_type, json.dumps(event_data))
-            
-            # Wait for expected responses if specified
-            if step.expected_responses:
-                responses_received = await self._wait_for_step_responses(step)
-                step_success = len(responses_received) >= len(step.expected_responses) * 0.8  # 80% response rate
+                step_success, _ = await asyncio.gather(
+                    self._publish_step(step),
+                    asyncio.sleep(step.delay_seconds)
+                )
             else:
-                step_success = True
-            
-            # Cancel step timeout
-            if self.step_timeout_task:
-                self.step_timeout_task.cancel()
-                self.step_timeout_task = None
+                step_success = await self._publish_step(step)
             
             self.logger.info(f"✅ Step completed: {step.step_id} - Success: {step_success}")
             return step_success
@@ -377,29 +499,71 @@ class RoutineMaintenanceScenario:
             self.logger.error(f"Error executing step {step.step_id}: {e}")
             return False
     
-    async def _wait_for_step_responses(self, step: ScenarioStepRuntime) -> List[Dict[str, Any]]:
+    async def _publish_step(self, step: ScenarioStepRuntime) -> bool:
+        """Publish a step event and wait for its expected responses"""
+        # Publish step event
+        timestamp = datetime.now(timezone.utc).isoformat()
+        cached = _STEP_PAYLOAD_HEADS.get(step.step_id)
+        if cached is not None and cached[0] == step.event_data:
+            payload = cached[1] + timestamp + '"}'
+        else:
+            # Step added or edited after import; serialize it in full
+            payload = dumps({
+                **step.event_data,
+                "scenario_id": self._scenario_id,
+                "step_id": step.step_id,
+                "timestamp": timestamp
+            })
+        
+        await self.event_bus.publish(step.event_type, payload)
+        
+        # Wait for expected responses if specified
+        if step.expected_responses:
+            responses_received = await self._wait_for_step_responses(step)
+            return len(responses_received) >= len(step.expected_responses) * 0.8  # 80% response rate
+        
+        return True
+    
+    async def _wait_for_step_responses(self, step: ScenarioStepRuntime) -> List[_MaintenanceResponse]:
         """Wait for expected responses to a maintenance step"""
         responses_received = []
-        timeout_time = datetime.now(timezone.utc) + timedelta(seconds=step.timeout_seconds)
-        
-        while datetime.now(timezone.utc) < timeout_time and len(responses_received) < len(step.expected_responses):
-            # Check for new responses from required agents
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + step.timeout_seconds
+        expected_count = len(step.expected_responses)
+        step_start_counts = self._step_start_counts
+        seen_agents = set()
+        # Drop any wake-up left over from an earlier step; the first scan below covers it
+        self._response_event.clear()
+        
+        while True:
+            # Collect responses stored since step start from agents not yet heard from
             for agent_type in step.required_agents:
-                if agent_type in self.agent_responses:
-                    agent_responses = self.agent_responses[agent_type]
-                    
-                    # Find responses that occurred after step start
-                    new_responses = [
-                        resp for resp in agent_responses
-                        if resp.get("timestamp", 0) >= self.step_start_time.timestamp() and
-                        agent_type not in [r.get("agent_type") for r in responses_received]
-                    ]
-                    
-                    if new_responses:
-                        responses_received.extend(new_responses)
+                if agent_type in seen_agents:
+                    continue
+                
+                agent_responses = self.agent_responses.get(agent_type)
+                if agent_responses is None:
+                    continue
+                
+                start_index = step_start_counts.get(agent_type, 0)
+                if len(agent_responses) > start_index:
+                    responses_received.extend(islice(agent_responses, start_index, None))
+                    seen_agents.add(agent_type)
             
-            # Short sleep to avoid busy waiting
-            await asyncio.sleep(0.1)
+            remaining = deadline - loop.time()
+            if len(responses_received) >= expected_count or remaining <= 0:
+                break
+            
+            # Sleep until a handler stores a new response (or the step times out)
+            try:
+                await asyncio.wait_for(self._response_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+            self._response_event.clear()
+        
+        # The step deadline is enforced here; there is no separate timeout task
+        if len(responses_received) < expected_count:
+            self.logger.warning(f"⏰ Step timeout: {step.step_id} after {step.timeout_seconds} seconds")
         
         return responses_received
     
@@ -409,7 +573,7 @@ class RoutineMaintenanceScenario:
             return False
         
         end_time = datetime.now(timezone.utc)
-        total_duration = (end_time - self.start_time).total_seconds()
+        total_duration = time.monotonic() - self._start_monotonic
         
         # Calculate success metrics
         success = (
@@ -440,24 +604,27 @@ class RoutineMaintenanceScenario:
             return
         
         # Update result
-        self.maintenance_result.end_time = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        self.maintenance_result.end_time = now
         self.maintenance_result.duration_seconds = (
             self.maintenance_result.end_time - self.maintenance_result.start_time
         ).total_seconds()
         self.maintenance_result.success = success
-        self.maintenance_result.agent_responses = dict(self.agent_responses)
+        self.maintenance_result.agent_responses = {
+            agent: [response.to_record() for response in responses]
+            for agent, responses in self.agent_responses.items()
+        }
         self.maintenance_result.events = list(self.maintenance_events)
         
         # Publish completion event
-        await self.event_bus.publish(
+        await self._publish_lifecycle(
             "demo.scenario.completed",
-            json.dumps({
-                "scenario_id": "routine_maintenance_demo",
+            {
                 "success": success,
                 "duration_seconds": self.maintenance_result.duration_seconds,
-                "steps_completed": self.maintenance_result.steps_completed,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
+                "steps_completed": self.maintenance_result.steps_completed
+            },
+            now
         )
         
         self.logger.info(
@@ -472,35 +639,41 @@ class RoutineMaintenanceScenario:
             return
         
         # Update result
-        self.maintenance_result.end_time = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        self.maintenance_result.end_time = now
         self.maintenance_result.duration_seconds = (
             self.maintenance_result.end_time - self.maintenance_result.start_time
         ).total_seconds()
         self.maintenance_result.success = False
         self.maintenance_result.error_message = error_message
-        self.maintenance_result.agent_responses = dict(self.agent_responses)
+        self.maintenance_result.agent_responses = {
+            agent: [response.to_record() for response in responses]
+            for agent, responses in self.agent_responses.items()
+        }
         self.maintenance_result.events = list(self.maintenance_events)
         
         # Publish failure event
-        await self.event_bus.publish(
+        await self._publish_lifecycle(
             "demo.scenario.failed",
-            json.dumps({
-                "scenario_id": "routine_maintenance_demo",
+            {
                 "error_message": error_message,
-                "duration_seconds": self.maintenance_result.duration_seconds,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
+                "duration_seconds": self.maintenance_result.duration_seconds
+            },
+            now
         )
         
         self.logger.error(f"❌ Routine maintenance failed: {error_message}")
     
-    async def _step_timeout_handler(self, timeout_seconds: float, step_id: str):
-        """Handle step timeout"""
-        try:
-            await asyncio.sleep(timeout_seconds)
-            self.logger.warning(f"⏰ Step timeout: {step_id} after {timeout_seconds} seconds")
-        except asyncio.CancelledError:
-            pass
+    async def _publish_lifecycle(self, event_type: str, fields: Dict[str, Any], timestamp: datetime):
+        """Publish a scenario lifecycle event with the common scenario_id/timestamp envelope"""
+        await self.event_bus.publish(
+            event_type,
+            dumps({
+                "scenario_id": self._scenario_id,
+                **fields,
+                "timestamp": timestamp.isoformat()
+            })
+        )
     
     def get_maintenance_status(self) -> Dict[str, Any]:
         """Get current maintenance status"""
@@ -511,14 +684,13 @@ class RoutineMaintenanceScenario:
                 "phase": None
             }
         
-        current_time = datetime.now(timezone.utc)
-        elapsed_time = (current_time - self.start_time).total_seconds()
+        elapsed_time = time.monotonic() - self._start_monotonic
         remaining_time = max(0, self.max_duration_seconds - elapsed_time)
         
         return {
             "active": True,
             "status": "active",
-            "phase": self.current_phase.value,
+            "phase": self._current_phase_str,
             "elapsed_seconds": elapsed_time,
             "remaining_seconds": remaining_time,
             "completion_percentage": min(100, (elapsed_time / self.max_duration_seconds) * 100),
@@ -533,7 +705,7 @@ class RoutineMaintenanceScenario:
         """Get performance metrics for routine maintenance"""
         metrics = {
             "max_duration_seconds": self.max_duration_seconds,
-            "current_phase": self.current_phase.value,
+            "current_phase": self._current_phase_str,
             "total_steps": len(self.maintenance_steps),
             "steps_completed": self.maintenance_result.steps_completed if self.maintenance_result else 0,
             "agents_responded": len(self.agent_responses),
@@ -548,15 +720,13 @@ class RoutineMaintenanceScenario:
             })
         
         if self.start_time:
-            metrics["current_execution_time"] = (datetime.now(timezone.utc) - self.start_time).total_seconds()
+            metrics["current_execution_time"] = time.monotonic() - self._start_monotonic
         
         # Add agent response statistics
         metrics["agent_statistics"] = {
-            "total_responses": sum(len(responses) for responses in self.agent_responses.values()),
+            "total_responses": self._total_responses,
             "unique_agents": len(self.agent_responses),
-            "response_distribution": {
-                agent: len(responses) for agent, responses in self.agent_responses.items()
-            }
+            "response_distribution": dict(self._per_agent_counts)
         }
         
         return metrics
@@ -566,19 +736,20 @@ class RoutineMaintenanceScenario:
         try:
             self.logger.info("🔄 Resetting maintenance state...")
             
-            # Cancel any running timeouts
-            if self.step_timeout_task:
-                self.step_timeout_task.cancel()
-                self.step_timeout_task = None
+            # Stop the ingress worker and drop events queued for the old run
+            await self._stop_ingress()
             
             # Reset all state variables
-            self.current_phase = MaintenancePhase.DETECTION
-            self.maintenance_steps.clear()
+            self._set_phase(MaintenancePhase.DETECTION)
             self.maintenance_result = None
             self.start_time = None
+            self._start_monotonic = None
             self.current_step_index = 0
             self.step_start_time = None
             self.agent_responses.clear()
+            self._total_responses = 0
+            self._per_agent_counts.clear()
+            self._step_start_counts = {}
             self.maintenance_events.clear()
             
             # Recreate maintenance steps
@@ -587,7 +758,7 @@ class RoutineMaintenanceScenario:
             # Publish reset event
             await self.event_bus.publish(
                 "demo.scenario.reset",
-                json.dumps({
+                dumps({
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                     "status": "completed"
                 })
@@ -600,8 +771,35 @@ class RoutineMaintenanceScenario:
             self.logger.error(f"Error resetting maintenance: {e}")
             return False
     
+    async def _stop_ingress(self):
+        """Cancel the ingress worker and drop any events still queued for it"""
+        if self._ingress_task:
+            self._ingress_task.cancel()
+            try:
+                await self._ingress_task
+            except asyncio.CancelledError:
+                pass
+            self._ingress_task = None
+        while not self._ingress.empty():
+            self._ingress.get_nowait()
+            self._ingress.task_done()
+    
+    async def shutdown(self):
+        """Stop background work before the event loop closes"""
+        if self._maintenance_task and not self._maintenance_task.done():
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+        self._maintenance_task = None
+        await self._stop_ingress()
+    
     async def integrate_with_orchestrator(self) -> bool:
         """Integrate with the scenario orchestrator"""
+        if self._orchestrator_integrated:
+            return True
+        
         try:
             self.logger.info("🔗 Integrating routine maintenance with orchestrator")
             
@@ -611,6 +809,7 @@ class RoutineMaintenanceScenario:
                 self._handle_orchestrator_event
             )
             self.active_subscriptions.append("demo.scenario.start")
+            self._orchestrator_integrated = True
             
             return True
             
@@ -621,13 +820,27 @@ class RoutineMaintenanceScenario:
     async def _handle_orchestrator_event(self, message: str):
         """Handle events from the scenario orchestrator"""
         try:
-            data = json.loads(message) if isinstance(message, str) else message
+            # Cheap substring check so other scenarios' start events are never decoded
+            if isinstance(message, str):
+                if "routine_maintenance" not in message:
+                    return
+                data = loads(message)
+            else:
+                data = message
             
             if data.get("scenario") == "routine_maintenance":
+                if self._maintenance_running:
+                    self.logger.debug("Routine maintenance already running, ignoring duplicate start")
+                    return
+                
                 self.logger.info("🎭 Orchestrator routine maintenance scenario detected")
                 
-                # Start our routine maintenance implementation
-                await self.start_maintenance()
+                # Start our routine maintenance implementation as a task. Awaiting it here would
+                # hold the bus worker for the whole run, so the detection step's own
+                # demo.scenario.start would only arrive after the flag cleared and start a
+                # new run. Set the flag now so it covers the gap before the task first runs.
+                self._maintenance_running = True
+                self._maintenance_task = asyncio.create_task(self.start_maintenance())
                 
         except Exception as e:
             self.logger.error(f"Error handling orchestrator event: {e}")
\ No newline at end of file
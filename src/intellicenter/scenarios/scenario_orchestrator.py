@@ -14,10 +14,14 @@ Features:
 """
 
 import asyncio
-import json
+import copy
+import functools
+import sys
 import time
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional, Callable
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import ClassVar, Deque, Dict, List, Any, Optional, Callable, Tuple, Union
 
 from intellicenter.shared.event_bus import EventBus
 from intellicenter.shared.logger import logger
@@ -29,10 +33,444 @@ from intellicenter.shared.schema import (
     ScenarioStep,
     ScenarioType,
 )
+from intellicenter.shared.serialization import JSONDecodeError, dumps, loads
 
 
 # Removed local Enum and dataclass definitions as they are now in shared.schema
 
+# Agent implied by an event type's leading segment ("facility" events are split one level deeper)
+_AGENT_BY_PREFIX = {
+    "hvac": "hvac_agent",
+    "power": "power_agent",
+    "security": "security_agent",
+    "network": "network_agent",
+    "facility.coordination": "coordinator_agent",
+    "facility.maintenance": "coordinator_agent"
+}
+
+MAX_SCENARIO_EVENTS = 4096  # Scenario events retained per run (oldest dropped first)
+RECENT_EVENTS_SHOWN = 5  # Events listed under "recent_events" in get_scenario_state
+STATE_CACHE_SECONDS = 0.1  # How long an unchanged get_scenario_state snapshot is reused
+
+
+@dataclass(slots=True)
+class _AgentResponseEvent:
+    """Agent response; one instance is shared by agent_responses and the scenario event log"""
+    type: ClassVar[str] = "agent_response"
+    timestamp: datetime
+    event_type: str
+    agent_type: str
+    data: Dict[str, Any]
+    scenario_step: Optional[int]
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Materialize into the event dict shape stored on ScenarioResult.events"""
+        return {
+            "type": self.type,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "agent_type": self.agent_type,
+            "data": self.data
+        }
+    
+    def to_response_record(self) -> Dict[str, Any]:
+        """Materialize into the response dict shape stored on ScenarioResult.agent_responses"""
+        return {
+            "event_type": self.event_type,
+            "timestamp": self.timestamp,
+            "agent_type": self.agent_type,
+            "data": self.data,
+            "scenario_step": self.scenario_step
+        }
+
+
+@dataclass(slots=True)
+class _StepCompletedEvent:
+    """Step outcome recorded in the scenario event log"""
+    type: ClassVar[str] = "step_completed"
+    timestamp: datetime
+    step_id: str
+    success: bool
+    step_index: int
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Materialize into the dict shape stored on ScenarioResult"""
+        return {
+            "type": self.type,
+            "timestamp": self.timestamp,
+            "step_id": self.step_id,
+            "success": self.success,
+            "step_index": self.step_index
+        }
+
+
+_ScenarioEvent = Union[_AgentResponseEvent, _StepCompletedEvent]
+
+# Agent response topics the orchestrator records. Literals, so already interned: the handler
+# partials, event_handlers keys and stored event_type values all share these objects.
+_AGENT_EVENT_TYPES = (
+    "hvac.cooling.decision",
+    "power.optimization.decision",
+    "security.assessment.decision",
+    "network.assessment.decision",
+    "facility.coordination.directive",
+    "facility.coordination.scenario_orchestration",
+    "energy_optimization.energy_optimization_initiated",
+    "energy_optimization.energy_optimization_completed",
+    "energy_optimization.energy_optimization_resolving",
+    "hvac.system.status",
+    "network.connectivity.status",
+    "facility.maintenance.response"
+)
+
+# Lifecycle topics the orchestrator publishes
+_TOPIC_INITIALIZED = "demo.scenario.initialized"
+_TOPIC_COMPLETED = "demo.scenario.completed"
+_TOPIC_FAILED = "demo.scenario.failed"
+_TOPIC_RESET = "demo.scenario.reset"
+_TOPIC_PAUSED = "demo.scenario.paused"
+_TOPIC_RESUMED = "demo.scenario.resumed"
+_TOPIC_STOPPED = "demo.scenario.stopped"
+
+# States from which a new scenario may be triggered, and states with a scenario in flight
+_TRIGGERABLE_STATES = frozenset({ScenarioState.IDLE, ScenarioState.COMPLETED, ScenarioState.FAILED})
+_ACTIVE_STATES = frozenset({ScenarioState.RUNNING, ScenarioState.PAUSED})
+
+# Python 3.12+: tasks that finish without suspending skip the ready queue entirely
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+
+def _enable_eager_tasks():
+    """Install the eager task factory on the running loop unless another factory is set"""
+    if _eager_task_factory is None:
+        return
+    
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(_eager_task_factory)
+
+
+@functools.lru_cache(maxsize=64)
+def _initialized_head(scenario_id: str, scenario_type: str, name: str) -> str:
+    """Serialized demo.scenario.initialized payload up to the timestamp value"""
+    return dumps({
+        "scenario_id": scenario_id,
+        "scenario_type": scenario_type,
+        "name": name
+    })[:-1] + ',"timestamp":"'
+
+
+@functools.cache
+def _routine_maintenance_class() -> type:
+    """Import RoutineMaintenanceScenario only when a caller first needs it"""
+    from .routine_maintenance import RoutineMaintenanceScenario
+    return RoutineMaintenanceScenario
+
+
+def _build_scenario_definitions() -> Dict[ScenarioType, ScenarioConfig]:
+    """Create built-in demo scenario definitions"""
+    scenarios = {}
+    
+    # Cooling Crisis Scenario
+    scenarios[ScenarioType.COOLING_CRISIS] = ScenarioConfig(
+        scenario_id="cooling_crisis_demo",
+        name="Cooling Crisis Response",
+        description="Demonstrates coordinated response to cooling system failure",
+        scenario_type=ScenarioType.COOLING_CRISIS,
+        max_duration_seconds=120.0,  # 2 minutes
+        steps=[
+            ScenarioStep(
+                step_id="normal_operation",
+                description="Normal facility operation",
+                event_type="demo.scenario.start",
+                event_data={"scenario": "cooling_crisis", "phase": "normal"},
+                delay_seconds=2.0
+            ),
+            ScenarioStep(
+                step_id="temperature_rise",
+                description="Initial temperature increase detected",
+                event_type="hvac.temperature.changed",
+                event_data={"temperature": 26.5, "trend": "rising", "rate": 0.5, "location": "server_room_main"},
+                delay_seconds=3.0,
+                expected_responses=["hvac.cooling.decision"],
+                required_agents=[AgentType.HVAC]
+            ),
+            ScenarioStep(
+                step_id="cooling_failure",
+                description="Primary cooling system failure",
+                event_type="hvac.system.failure",
+                event_data={"system": "primary_cooling", "severity": "critical", "backup_available": True},
+                delay_seconds=2.0,
+                expected_responses=["hvac.cooling.decision", "facility.coordination.directive"],
+                required_agents=[AgentType.HVAC, AgentType.COORDINATOR]
+            ),
+            ScenarioStep(
+                step_id="emergency_temperature",
+                description="Emergency temperature threshold reached",
+                event_type="hvac.temperature.changed",
+                event_data={"temperature": 30.0, "trend": "rising", "rate": 1.2, "emergency": True},
+                delay_seconds=5.0,
+                expected_responses=["hvac.cooling.decision", "power.optimization.decision", "facility.coordination.directive"],
+                required_agents=[AgentType.HVAC, AgentType.POWER, AgentType.COORDINATOR],
+                timeout_seconds=15.0
+            ),
+            ScenarioStep(
+                step_id="coordination_response",
+                description="Multi-agent coordination response",
+                event_type="facility.coordination.scenario",
+                event_data={"scenario_type": "temperature_emergency", "emergency_level": "critical", "agent_responses": {}},
+                delay_seconds=1.0,
+                expected_responses=["facility.coordination.scenario_orchestration"],
+                required_agents=[AgentType.COORDINATOR]
+            )
+        ],
+        success_criteria={
+            "max_response_time": 15.0,
+            "required_agents_responded": [AgentType.HVAC, AgentType.POWER, AgentType.COORDINATOR],
+            "coordination_achieved": True,
+            "temperature_stabilized": True
+        },
+        cleanup_steps=[
+            ScenarioStep(
+                step_id="reset_temperature",
+                description="Reset temperature to normal",
+                event_type="hvac.temperature.changed",
+                event_data={"temperature": 22.0, "trend": "stable", "status": "normal"},
+                delay_seconds=1.0
+            ),
+            ScenarioStep(
+                step_id="reset_systems",
+                description="Reset all systems to normal operation",
+                event_type="demo.scenario.reset",
+                event_data={"scenario": "cooling_crisis", "status": "reset"},
+                delay_seconds=1.0
+            )
+        ]
+    )
+    
+    # Security Breach Scenario
+    scenarios[ScenarioType.SECURITY_BREACH] = ScenarioConfig(
+        scenario_id="security_breach_demo",
+        name="Security Breach Response",
+        description="Demonstrates coordinated lockdown response to security breach",
+        scenario_type=ScenarioType.SECURITY_BREACH,
+        max_duration_seconds=90.0,  # 1.5 minutes
+        steps=[
+            ScenarioStep(
+                step_id="normal_security",
+                description="Normal security operation",
+                event_type="demo.scenario.start",
+                event_data={"scenario": "security_breach", "phase": "normal"},
+                delay_seconds=2.0
+            ),
+            ScenarioStep(
+                step_id="suspicious_access",
+                description="Suspicious access attempt detected",
+                event_type="security.access.suspicious",
+                event_data={"location": "server_room_a", "severity": "medium", "user_id": "unknown_user_001", "attempts": 3},
+                delay_seconds=3.0,
+                expected_responses=["security.assessment.decision"],
+                required_agents=[AgentType.SECURITY]
+            ),
+            ScenarioStep(
+                step_id="breach_confirmed",
+                description="Security breach confirmed",
+                event_type="security.breach.detected",
+                event_data={"location": "server_room_a", "severity": "high", "breach_type": "unauthorized_access"},
+                delay_seconds=2.0,
+                expected_responses=["security.assessment.decision", "network.assessment.decision"],
+                required_agents=[AgentType.SECURITY, AgentType.NETWORK]
+            ),
+            ScenarioStep(
+                step_id="lockdown_initiated",
+                description="Facility lockdown initiated",
+                event_type="security.lockdown.initiated",
+                event_data={"scope": "facility_wide", "duration": "indefinite", "reason": "security_breach"},
+                delay_seconds=1.0,
+                expected_responses=["security.assessment.decision", "network.assessment.decision", "facility.coordination.directive"],
+                required_agents=[AgentType.SECURITY, AgentType.NETWORK, AgentType.COORDINATOR],
+                timeout_seconds=10.0
+            ),
+            ScenarioStep(
+                step_id="coordination_lockdown",
+                description="Coordinated lockdown response",
+                event_type="facility.coordination.scenario",
+                event_data={"scenario_type": "security_breach", "emergency_level": "high", "agent_responses": {}},
+                delay_seconds=1.0,
+                expected_responses=["facility.coordination.scenario_orchestration"],
+                required_agents=[AgentType.COORDINATOR]
+            )
+        ],
+        success_criteria={
+            "max_response_time": 10.0,
+            "required_agents_responded": ["security_agent", "network_agent", "coordinator_agent"],
+            "lockdown_coordinated": True,
+            "access_denied": True
+        },
+        cleanup_steps=[
+            ScenarioStep(
+                step_id="lift_lockdown",
+                description="Lift security lockdown",
+                event_type="security.lockdown.lifted",
+                event_data={"scope": "facility_wide", "reason": "demo_complete"},
+                delay_seconds=1.0
+            ),
+            ScenarioStep(
+                step_id="reset_security",
+                description="Reset security systems to normal",
+                event_type="demo.scenario.reset",
+                event_data={"scenario": "security_breach", "status": "reset"},
+                delay_seconds=1.0
+            )
+        ]
+    )
+    
+    # Energy Optimization Scenario
+    scenarios[ScenarioType.ENERGY_OPTIMIZATION] = ScenarioConfig(
+        scenario_id="energy_optimization_demo",
+        name="Energy Optimization",
+        description="Demonstrates proactive energy cost optimization",
+        scenario_type=ScenarioType.ENERGY_OPTIMIZATION,
+        max_duration_seconds=180.0,  # 3 minutes
+        steps=[
+            ScenarioStep(
+                step_id="energy_analysis",
+                description="Energy consumption analysis and optimization opportunity identification",
+                event_type="power.consumption.changed",
+                event_data={"consumption": 85.0, "trend": "high", "optimization_opportunity": True, "threshold_exceeded": True},
+                delay_seconds=2.0,
+                expected_responses=["power.optimization.decision"],
+                required_agents=["power_agent"]
+            ),
+            ScenarioStep(
+                step_id="pre_cooling_strategy",
+                description="Pre-cooling strategy implementation for energy arbitrage",
+                event_type="hvac.temperature.changed",
+                event_data={"temperature": 20.0, "trend": "decreasing", "rate": -0.5, "pre_cooling": True, "strategy": "energy_arbitrage"},
+                delay_seconds=3.0,
+                expected_responses=["hvac.cooling.decision"],
+                required_agents=["hvac_agent"]
+            ),
+            ScenarioStep(
+                step_id="power_coordination",
+                description="Power system optimization and load balancing",
+                event_type="power.optimization.decision",
+                event_data={"optimization_level": "aggressive", "reasoning": "Energy cost optimization required", "agent_type": "power_specialist", "price_based": True},
+                delay_seconds=2.0,
+                expected_responses=["power.optimization.decision"],
+                required_agents=["power_agent"]
+            ),
+            ScenarioStep(
+                step_id="coordination_response",
+                description="Coordinated response between power and HVAC systems",
+                event_type="facility.coordination.scenario",
+                event_data={"scenario_type": "power_overload", "emergency_level": "normal", "agent_responses": {}},
+                delay_seconds=1.0,
+                expected_responses=["facility.coordination.directive"],
+                required_agents=[AgentType.COORDINATOR]
+            ),
+            ScenarioStep(
+                step_id="optimization_verification",
+                description="Verify optimization success and system stabilization",
+                event_type="hvac.temperature.changed",
+                event_data={"temperature": 22.0, "trend": "stable", "rate": 0.0, "verification_required": True, "optimization_complete": True},
+                delay_seconds=2.0,
+                expected_responses=["hvac.cooling.decision", "power.optimization.decision", "facility.coordination.directive"],
+                required_agents=["power_agent", "hvac_agent", "coordinator_agent"],
+                timeout_seconds=15.0
+            )
+        ],
+        success_criteria={
+            "max_response_time": 15.0,
+            "required_agents_responded": ["power_agent", "hvac_agent", "coordinator_agent"],
+            "coordination_achieved": True,
+            "energy_savings_achieved": True,
+            "optimization_complete": True
+        },
+        cleanup_steps=[
+            ScenarioStep(
+                step_id="system_stabilization",
+                description="System stabilization completed",
+                event_type="hvac.temperature.changed",
+                event_data={"temperature": 22.0, "trend": "stable", "rate": 0.0, "stabilization_status": "All systems operating at optimal efficiency"},
+                delay_seconds=1.0
+            ),
+            ScenarioStep(
+                step_id="reset_energy",
+                description="Reset energy systems to normal",
+                event_type="demo.scenario.reset",
+                event_data={"scenario": "energy_optimization", "status": "reset"},
+                delay_seconds=1.0
+            )
+        ]
+    )
+    
+    # Routine Maintenance Scenario
+    scenarios[ScenarioType.ROUTINE_MAINTENANCE] = ScenarioConfig(
+        scenario_id="routine_maintenance_demo",
+        name="Routine Maintenance",
+        description="Demonstrates simple HVAC-Network coordination for routine maintenance",
+        scenario_type=ScenarioType.ROUTINE_MAINTENANCE,
+        max_duration_seconds=60.0,  # 1 minute - quick completion for demo
+        steps=[
+            ScenarioStep(
+                step_id="maintenance_detection",
+                description="Detect scheduled maintenance window",
+                event_type="demo.scenario.start",
+                event_data={"scenario": "routine_maintenance", "phase": "detection"},
+                delay_seconds=1.0
+            ),
+            ScenarioStep(
+                step_id="hvac_system_check",
+                description="Perform HVAC system status check",
+                event_type="hvac.system.status",
+                event_data={"system": "hvac", "status": "check", "location": "server_room_main"},
+                delay_seconds=5.0,
+                expected_responses=["hvac.system.status"],
+                required_agents=["hvac_agent"]
+            ),
+            ScenarioStep(
+                step_id="network_connectivity_check",
+                description="Validate network connectivity and performance",
+                event_type="network.connectivity.status",
+                event_data={"system": "network", "status": "validation", "location": "server_room_main"},
+                delay_seconds=5.0,
+                expected_responses=["network.connectivity.status"],
+                required_agents=["network_agent"]
+            ),
+            ScenarioStep(
+                step_id="coordination_completion",
+                description="Complete coordination and verification",
+                event_type="facility.maintenance.completion",
+                event_data={"scenario_complete": True, "location": "server_room_main"},
+                delay_seconds=3.0,
+                expected_responses=["facility.maintenance.completion"],
+                required_agents=[AgentType.COORDINATOR]
+            )
+        ],
+        success_criteria={
+            "maintenance_completed": True,
+            "systems_validated": True,
+            "coordination_achieved": True
+        },
+        cleanup_steps=[
+            ScenarioStep(
+                step_id="reset_maintenance_state",
+                description="Reset maintenance state",
+                event_type="facility.maintenance.reset",
+                event_data={"reset": True},
+                delay_seconds=1.0
+            )
+        ]
+    )
+    
+    return scenarios
+
+
+# Built once at import; each orchestrator takes a deep copy, because ScenarioConfig and the
+# success_criteria / event_data dicts it holds are mutable
+_SCENARIO_DEFINITIONS = _build_scenario_definitions()
+
 
 class ScenarioOrchestrator:
     """
@@ -42,371 +480,138 @@ class ScenarioOrchestrator:
     event coordination, timing constraints, and reset functionality.
     """
     
+    __slots__ = (
+        "event_bus",
+        "logger",
+        "current_scenario",
+        "_scenario_state",
+        "scenario_result",
+        "start_time",
+        "_start_monotonic",
+        "current_step",
+        "step_start_time",
+        "agent_responses",
+        "_total_responses",
+        "scenario_events",
+        "_event_type_counts",
+        "_recent_events",
+        "_step_responses",
+        "_step_expected",
+        "_pending_events",
+        "_drain_handle",
+        "event_handlers",
+        "active_subscriptions",
+        "_scenario_timeout",
+        "scenario_definitions",
+        "_payload_heads",
+        "_state_dirty",
+        "_state_cache",
+        "_state_cached_at",
+    )
+    
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
         self.logger = logger.bind(component="scenario_orchestrator")
         
         # Scenario state management
         self.current_scenario: Optional[ScenarioConfig] = None
-        self.scenario_state: ScenarioState = ScenarioState.IDLE
+        self._scenario_state: ScenarioState = ScenarioState.IDLE
         self.scenario_result: Optional[ScenarioResult] = None
         
         # Execution tracking
         self.start_time: Optional[datetime] = None
+        self._start_monotonic: Optional[float] = None  # elapsed-time arithmetic
         self.current_step: int = 0
         self.step_start_time: Optional[datetime] = None
-        self.agent_responses: Dict[str, List[Dict[str, Any]]] = {}
-        self.scenario_events: List[Dict[str, Any]] = []
+        self.agent_responses: Dict[str, List[_AgentResponseEvent]] = defaultdict(list)
+        self._total_responses = 0  # running sum of len() over agent_responses buckets
+        self.scenario_events: Deque[_ScenarioEvent] = deque(maxlen=MAX_SCENARIO_EVENTS)
+        # Per-type counts of the events currently held in scenario_events; see _record_event
+        self._event_type_counts: Counter = Counter()
+        # Tail of the log shown by get_scenario_state
+        self._recent_events: Deque[_ScenarioEvent] = deque(maxlen=RECENT_EVENTS_SHOWN)
+        # Responses matching the current step's expected_responses, consumed by _wait_for_responses
+        self._step_responses: asyncio.Queue = asyncio.Queue()
+        self._step_expected: frozenset = frozenset()  # current step's expected_responses
+        # Raw agent events awaiting _drain_events, and its scheduled callback
+        self._pending_events: Deque[Tuple[str, Any]] = deque()
+        self._drain_handle: Optional[asyncio.Handle] = None
         
         # Event handlers and subscriptions
         self.event_handlers: Dict[str, Callable] = {}
         self.active_subscriptions: List[str] = []
         
         # Timing and constraints
-        self.scenario_timeout_task: Optional[asyncio.Task] = None
-        self.step_timeout_task: Optional[asyncio.Task] = None
+        # Deadline scope around _execute_scenario; rescheduled rather than recreated on pause/resume
+        self._scenario_timeout: Optional[asyncio.Timeout] = None
         
-        # Built-in scenario definitions
-        self.scenario_definitions = self._create_scenario_definitions()
+        # Built-in scenario definitions; deep copies so edits stay local to this orchestrator
+        self.scenario_definitions = {
+            scenario_type: config.model_copy(deep=True)
+            for scenario_type, config in _SCENARIO_DEFINITIONS.items()
+        }
+        # Serialized step payload heads keyed by (id(step), extra fields); see _payload_head
+        self._payload_heads: Dict[tuple, Tuple[ScenarioStep, Dict[str, Any], str]] = {}
         
-        # Import routine maintenance scenario
-        from .routine_maintenance import RoutineMaintenanceScenario
-        self.RoutineMaintenanceScenario = RoutineMaintenanceScenario
+        # Last get_scenario_state snapshot; dropped when state, step or event log changes
+        self._state_dirty = True
+        self._state_cache: Optional[Dict[str, Any]] = None
+        self._state_cached_at = 0.0
         
         # Setup base event subscriptions
         self._setup_base_subscriptions()
     
-    def _create_scenario_definitions(self) -> Dict[ScenarioType, ScenarioConfig]:
-        """Create built-in demo scenario definitions"""
-        scenarios = {}
-        
-        # Cooling Crisis Scenario
-        scenarios[ScenarioType.COOLING_CRISIS] = ScenarioConfig(
-            scenario_id="cooling_crisis_demo",
-            name="Cooling Crisis Response",
-            description="Demonstrates coordinated response to cooling system failure",
-            scenario_type=ScenarioType.COOLING_CRISIS,
-            max_duration_seconds=120.0,  # 2 minutes
-            steps=[
-                ScenarioStep(
-                    step_id="normal_operation",
-                    description="Normal facility operation",
-                    event_type="demo.scenario.start",
-                    event_data={"scenario": "cooling_crisis", "phase": "normal"},
-                    delay_seconds=2.0
-                ),
-                ScenarioStep(
-                    step_id="temperature_rise",
-                    description="Initial temperature increase detected",
-                    event_type="hvac.temperature.changed",
-                    event_data={"temperature": 26.5, "trend": "rising", "rate": 0.5, "location": "server_room_main"},
-                    delay_seconds=3.0,
-                    expected_responses=["hvac.cooling.decision"],
-                    required_agents=[AgentType.HVAC]
-                ),
-                ScenarioStep(
-                    step_id="cooling_failure",
-                    description="Primary cooling system failure",
-                    event_type="hvac.system.failure",
-                    event_data={"system": "primary_cooling", "severity": "critical", "backup_available": True},
-                    delay_seconds=2.0,
-                    expected_responses=["hvac.cooling.decision", "facility.coordination.directive"],
-                    required_agents=[AgentType.HVAC, AgentType.COORDINATOR]
-                ),
-                ScenarioStep(
-                    step_id="emergency_temperature",
-                    description="Emergency temperature threshold reached",
-                    event_type="hvac.temperature.changed",
-                    event_data={"temperature": 30.0, "trend": "rising", "rate": 1.2, "emergency": True},
-                    delay_seconds=5.0,
-                    expected_responses=["hvac.cooling.decision", "power.optimization.decision", "facility.coordination.directive"],
-                    required_agents=[AgentType.HVAC, AgentType.POWER, AgentType.COORDINATOR],
-                    timeout_seconds=15.0
-                ),
-                ScenarioStep(
-                    step_id="coordination_response",
-                    description="Multi-agent coordination response",
-                    event_type="facility.coordination.scenario",
-                    event_data={"scenario_type": "temperature_emergency", "emergency_level": "critical", "agent_responses": {}},
-                    delay_seconds=1.0,
-                    expected_responses=["facility.coordination.scenario_orchestration"],
-                    required_agents=[AgentType.COORDINATOR]
-                )
-            ],
-            success_criteria={
-                "max_response_time": 15.0,
-                "required_agents_responded": [AgentType.HVAC, AgentType.POWER, AgentType.COORDINATOR],
-                "coordination_achieved": True,
-                "temperature_stabilized": True
-            },
-            cleanup_steps=[
-                ScenarioStep(
-                    step_id="reset_temperature",
-                    description="Reset temperature to normal",
-                    event_type="hvac.temperature.changed",
-                    event_data={"temperature": 22.0, "trend": "stable", "status": "normal"},
-                    delay_seconds=1.0
-                ),
-                ScenarioStep(
-                    step_id="reset_systems",
-                    description="Reset all systems to normal operation",
-                    event_type="demo.scenario.reset",
-                    event_data={"scenario": "cooling_crisis", "status": "reset"},
-                    delay_seconds=1.0
-                )
-            ]
-        )
-        
-        # Security Breach Scenario
-        scenarios[ScenarioType.SECURITY_BREACH] = ScenarioConfig(
-            scenario_id="security_breach_demo",
-            name="Security Breach Response",
-            description="Demonstrates coordinated lockdown response to security breach",
-            scenario_type=ScenarioType.SECURITY_BREACH,
-            max_duration_seconds=90.0,  # 1.5 minutes
-            steps=[
-                ScenarioStep(
-                    step_id="normal_security",
-                    description="Normal security operation",
-                    event_type="demo.scenario.start",
-                    event_data={"scenario": "security_breach", "phase": "normal"},
-                    delay_seconds=2.0
-                ),
-                ScenarioStep(
-                    step_id="suspicious_access",
-                    description="Suspicious access attempt detected",
-                    event_type="security.access.suspicious",
-                    event_data={"location": "server_room_a", "severity": "medium", "user_id": "unknown_user_001", "attempts": 3},
-                    delay_seconds=3.0,
-                    expected_responses=["security.assessment.decision"],
-                    required_agents=[AgentType.SECURITY]
-                ),
-                ScenarioStep(
-                    step_id="breach_confirmed",
-                    description="Security breach confirmed",
-                    event_type="security.breach.detected",
-                    event_data={"location": "server_room_a", "severity": "high", "breach_type": "unauthorized_access"},
-                    delay_seconds=2.0,
-                    expected_responses=["security.assessment.decision", "network.assessment.decision"],
-                    required_agents=[AgentType.SECURITY, AgentType.NETWORK]
-                ),
-                ScenarioStep(
-                    step_id="lockdown_initiated",
-                    description="Facility lockdown initiated",
-                    event_type="security.lockdown.initiated",
-                    event_data={"scope": "facility_wide", "duration": "indefinite", "reason": "security_breach"},
-                    delay_seconds=1.0,
-                    expected_responses=["security.assessment.decision", "network.assessment.decision", "facility.coordination.directive"],
-                    required_agents=[AgentType.SECURITY, AgentType.NETWORK, AgentType.COORDINATOR],
-                    timeout_seconds=10.0
-                ),
-                ScenarioStep(
-                    step_id="coordination_lockdown",
-                    description="Coordinated lockdown response",
-                    event_type="facility.coordination.scenario",
-                    event_data={"scenario_type": "security_breach", "emergency_level": "high", "agent_responses": {}},
-                    delay_seconds=1.0,
-                    expected_responses=["facility.coordination.scenario_orchestration"],
-                    required_agents=[AgentType.COORDINATOR]
-                )
-            ],
-            success_criteria={
-                "max_response_time": 10.0,
-                "required_agents_responded": ["security_agent", "network_agent", "coordinator_agent"],
-                "lockdown_coordinated": True,
-                "access_denied": True
-            },
-            cleanup_steps=[
-                ScenarioStep(
-                    step_id="lift_lockdown",
-                    description="Lift security lockdown",
-                    event_type="security.lockdown.lifted",
-                    event_data={"scope": "facility_wide", "reason": "demo_complete"},
-                    delay_seconds=1.0
-                ),
-                ScenarioStep(
-                    step_id="reset_security",
-                    description="Reset security systems to normal",
-                    event_type="demo.scenario.reset",
-                    event_data={"scenario": "security_breach", "status": "reset"},
-                    delay_seconds=1.0
-                )
-            ]
-        )
-        
-        # Energy Optimization Scenario
-        scenarios[ScenarioType.ENERGY_OPTIMIZATION] = ScenarioConfig(
-            scenario_id="energy_optimization_demo",
-            name="Energy Optimization",
-            description="Demonstrates proactive energy cost optimization",
-            scenario_type=ScenarioType.ENERGY_OPTIMIZATION,
-            max_duration_seconds=180.0,  # 3 minutes
-            steps=[
-                ScenarioStep(
-                    step_id="energy_analysis",
-                    description="Energy consumption analysis and optimization opportunity identification",
-                    event_type="power.consumption.changed",
-                    event_data={"consumption": 85.0, "trend": "high", "optimization_opportunity": True, "threshold_exceeded": True},
-                    delay_seconds=2.0,
-                    expected_responses=["power.optimization.decision"],
-                    required_agents=["power_agent"]
-                ),
-                ScenarioStep(
-                    step_id="pre_cooling_strategy",
-                    description="Pre-cooling strategy implementation for energy arbitrage",
-                    event_type="hvac.temperature.changed",
-                    event_data={"temperature": 20.0, "trend": "decreasing", "rate": -0.5, "pre_cooling": True, "strategy": "energy_arbitrage"},
-                    delay_seconds=3.0,
-                    expected_responses=["hvac.cooling.decision"],
-                    required_agents=["hvac_agent"]
-                ),
-                ScenarioStep(
-                    step_id="power_coordination",
-                    description="Power system optimization and load balancing",
-                    event_type="power.optimization.decision",
-                    event_data={"optimization_level": "aggressive", "reasoning": "Energy cost optimization required", "agent_type": "power_specialist", "price_based": True},
-                    delay_seconds=2.0,
-                    expected_responses=["power.optimization.decision"],
-                    required_agents=["power_agent"]
-                ),
-                ScenarioStep(
-                    step_id="coordination_response",
-                    description="Coordinated response between power and HVAC systems",
-                    event_type="facility.coordination.scenario",
-                    event_data={"scenario_type": "power_overload", "emergency_level": "normal", "agent_responses": {}},
-                    delay_seconds=1.0,
-                    expected_responses=["facility.coordination.directive"],
-                    required_agents=[AgentType.COORDINATOR]
-                ),
-                ScenarioStep(
-                    step_id="optimization_verification",
-                    description="Verify optimization success and system stabilization",
-                    event_type="hvac.temperature.changed",
-                    event_data={"temperature": 22.0, "trend": "stable", "rate": 0.0, "verification_required": True, "optimization_complete": True},
-                    delay_seconds=2.0,
-                    expected_responses=["hvac.cooling.decision", "power.optimization.decision", "facility.coordination.directive"],
-                    required_agents=["power_agent", "hvac_agent", "coordinator_agent"],
-                    timeout_seconds=15.0
-                )
-            ],
-            success_criteria={
-                "max_response_time": 15.0,
-                "required_agents_responded": ["power_agent", "hvac_agent", "coordinator_agent"],
-                "coordination_achieved": True,
-                "energy_savings_achieved": True,
-                "optimization_complete": True
-            },
-            cleanup_steps=[
-                ScenarioStep(
-                    step_id="system_stabilization",
-                    description="System stabilization completed",
-                    event_type="hvac.temperature.changed",
-                    event_data={"temperature": 22.0, "trend": "stable", "rate": 0.0, "stabilization_status": "All systems operating at optimal efficiency"},
-                    delay_seconds=1.0
-                ),
-                ScenarioStep(
-                    step_id="reset_energy",
-                    description="Reset energy systems to normal",
-                    event_type="demo.scenario.reset",
-                    event_data={"scenario": "energy_optimization", "status": "reset"},
-                    delay_seconds=1.0
-                )
-            ]
-        )
-        
-        # Routine Maintenance Scenario
-        scenarios[ScenarioType.ROUTINE_MAINTENANCE] = ScenarioConfig(
-            scenario_id="routine_maintenance_demo",
-            name="Routine Maintenance",
-            description="Demonstrates simple HVAC-Network coordination for routine maintenance",
-            scenario_type=ScenarioType.ROUTINE_MAINTENANCE,
-            max_duration_seconds=60.0,  # 1 minute - quick completion for demo
-            steps=[
-                ScenarioStep(
-                    step_id="maintenance_detection",
-                    description="Detect scheduled maintenance window",
-                    event_type="demo.scenario.start",
-                    event_data={"scenario": "routine_maintenance", "phase": "detection"},
-                    delay_seconds=1.0
-                ),
-                ScenarioStep(
-                    step_id="hvac_system_check",
-                    description="Perform HVAC system status check",
-                    event_type="hvac.system.status",
-                    event_data={"system": "hvac", "status": "check", "location": "server_room_main"},
-                    delay_seconds=5.0,
-                    expected_responses=["hvac.system.status"],
-                    required_agents=["hvac_agent"]
-                ),
-                ScenarioStep(
-                    step_id="network_connectivity_check",
-                    description="Validate network connectivity and performance",
-                    event_type="network.connectivity.status",
-                    event_data={"system": "network", "status": "validation", "location": "server_room_main"},
-                    delay_seconds=5.0,
-                    expected_responses=["network.connectivity.status"],
-                    required_agents=["network_agent"]
-                ),
-                ScenarioStep(
-                    step_id="coordination_completion",
-                    description="Complete coordination and verification",
-                    event_type="facility.maintenance.completion",
-                    event_data={"scenario_complete": True, "location": "server_room_main"},
-                    delay_seconds=3.0,
-                    expected_responses=["facility.maintenance.completion"],
-                    required_agents=[AgentType.COORDINATOR]
-                )
-            ],
-            success_criteria={
-                "maintenance_completed": True,
-                "systems_validated": True,
-                "coordination_achieved": True
-            },
-            cleanup_steps=[
-                ScenarioStep(
-                    step_id="reset_maintenance_state",
-                    description="Reset maintenance state",
-                    event_type="facility.maintenance.reset",
-                    event_data={"reset": True},
-                    delay_seconds=1.0
-                )
-            ]
-        )
-        
-        return scenarios
+    @property
+    def scenario_state(self) -> ScenarioState:
+        """Current scenario lifecycle state"""
+        return self._scenario_state
+    
+    @scenario_state.setter
+    def scenario_state(self, state: ScenarioState):
+        self._scenario_state = state
+        self._state_dirty = True
+    
+    @property
+    def RoutineMaintenanceScenario(self) -> type:
+        """Routine maintenance scenario class, imported on first use"""
+        return _routine_maintenance_class()
     
     def _setup_base_subscriptions(self):
         """Setup base event subscriptions for scenario coordination"""
         # Subscribe to agent response events
-        agent_events = [
-            "hvac.cooling.decision",
-            "power.optimization.decision",
-            "security.assessment.decision",
-            "network.assessment.decision",
-            "facility.coordination.directive",
-            "facility.coordination.scenario_orchestration",
-            "energy_optimization.energy_optimization_initiated",
-            "energy_optimization.energy_optimization_completed",
-            "energy_optimization.energy_optimization_resolving",
-            "hvac.system.status",
-            "network.connectivity.status",
-            "facility.maintenance.response"
-        ]
+        handlers = {
+            event_type: functools.partial(self._on_agent_event, event_type)
+            for event_type in _AGENT_EVENT_TYPES
+        }
+        self.event_bus.subscribe_many(handlers)
+        self.event_handlers.update(handlers)
+    
+    def _on_agent_event(self, event_type: str, message: str):
+        """Queue an agent response event (bound per event type via functools.partial)"""
+        # Nothing to attribute idle traffic to; _initialize_scenario would clear it anyway
+        if self.current_scenario is None:
+            return
         
-        for event_type in agent_events:
-            handler = self._create_response_handler(event_type)
-            self.event_bus.subscribe(event_type, handler)
-            self.event_handlers[event_type] = handler
+        self._pending_events.append((event_type, message))
+        if self._drain_handle is None:
+            # One drain per loop iteration records every event queued during it
+            self._drain_handle = asyncio.get_running_loop().call_soon(self._drain_events)
     
-    def _create_response_handler(self, event_type: str) -> Callable:
-        """Create a response handler for a specific event type"""
-        async def handler(message: str):
+    def _drain_events(self):
+        """Record all queued agent response events"""
+        self._drain_handle = None
+        pending = self._pending_events
+        now = datetime.now(timezone.utc)
+        scenario_step = self.current_step if self.current_scenario else None
+        
+        while pending:
+            event_type, message = pending.popleft()
             try:
                 # Parse message
                 if isinstance(message, str):
                     try:
-                        data = json.loads(message)
-                    except json.JSONDecodeError:
+                        data = loads(message)
+                    except JSONDecodeError:
                         data = {"raw_message": message}
                 else:
                     data = message
@@ -414,55 +619,42 @@ class ScenarioOrchestrator:
                 # Extract agent type from event or data
                 agent_type = self._extract_agent_type(event_type, data)
                 
-                # Record response
-                response_record = {
-                    "event_type": event_type,
-                    "timestamp": datetime.now(timezone.utc),
-                    "agent_type": agent_type,
-                    "data": data,
-                    "scenario_step": self.current_step if self.current_scenario else None
-                }
-                
-                # Store agent response
-                if agent_type not in self.agent_responses:
-                    self.agent_responses[agent_type] = []
-                self.agent_responses[agent_type].append(response_record)
-                
-                # Store scenario event
-                self.scenario_events.append({
-                    "type": "agent_response",
-                    "timestamp": datetime.now(timezone.utc),
-                    "event_type": event_type,
-                    "agent_type": agent_type,
-                    "data": data
-                })
+                # Store agent response and scenario event
+                record = _AgentResponseEvent(now, event_type, agent_type, data, scenario_step)
+                self.agent_responses[agent_type].append(record)
+                self._total_responses += 1
+                self._record_event(record)
+                if event_type in self._step_expected:
+                    self._step_responses.put_nowait(record)
                 
                 self.logger.debug(f"Recorded response: {event_type} from {agent_type}")
                 
             except Exception as e:
                 self.logger.error(f"Error in response handler for {event_type}: {e}")
-        
-        return handler
+    
+    def _record_event(self, event: _ScenarioEvent):
+        """Append to the scenario event log, keeping per-type counts in step with evictions"""
+        events = self.scenario_events
+        if len(events) == events.maxlen:
+            self._event_type_counts[events[0].type] -= 1
+        events.append(event)
+        self._event_type_counts[event.type] += 1
+        self._recent_events.append(event)
+        self._state_dirty = True
     
     def _extract_agent_type(self, event_type: str, data: Dict[str, Any]) -> str:
         """Extract agent type from event type or data"""
         # Try to get from data first
         if "agent_type" in data:
-            return data["agent_type"]
+            agent_type = data["agent_type"]
+            # Decoded per message; intern so agent_responses keys compare by identity
+            return sys.intern(agent_type) if isinstance(agent_type, str) else agent_type
         
         # Extract from event type
-        if "hvac." in event_type:
-            return "hvac_agent"
-        elif "power." in event_type:
-            return "power_agent"
-        elif "security." in event_type:
-            return "security_agent"
-        elif "network." in event_type:
-            return "network_agent"
-        elif "facility.coordination." in event_type or "facility.maintenance." in event_type:
-            return "coordinator_agent"
-        else:
-            return "unknown_agent"
+        prefix = event_type.partition(".")[0]
+        if prefix == "facility":
+            prefix = ".".join(event_type.split(".", 2)[:2])
+        return _AGENT_BY_PREFIX.get(prefix, "unknown_agent")
     
     async def trigger_scenario(self, scenario_type: ScenarioType) -> ScenarioResult:
         """
@@ -475,8 +667,10 @@ class ScenarioOrchestrator:
             ScenarioResult containing execution results
         """
         try:
+            _enable_eager_tasks()
+            
             # Check if scenario is already running
-            if self.scenario_state not in [ScenarioState.IDLE, ScenarioState.COMPLETED, ScenarioState.FAILED]:
+            if self.scenario_state not in _TRIGGERABLE_STATES:
                 raise RuntimeError(f"Cannot start scenario: current state is {self.scenario_state}")
             
             # Get scenario configuration
@@ -497,12 +691,13 @@ class ScenarioOrchestrator:
             self.logger.error(f"Error triggering scenario {scenario_type}: {e}")
             
             # Create error result
+            now = datetime.now(timezone.utc)
             error_result = ScenarioResult(
                 scenario_id=f"{scenario_type.value}_error",
                 scenario_type=scenario_type,
                 state=ScenarioState.FAILED,
-                start_time=datetime.now(timezone.utc),
-                end_time=datetime.now(timezone.utc),
+                start_time=now,
+                end_time=now,
                 success=False,
                 error_message=str(e),
                 steps_total=0  # Map total_steps to steps_total if needed, but schema has steps_total
@@ -521,11 +716,16 @@ class ScenarioOrchestrator:
         self.scenario_state = ScenarioState.INITIALIZING
         self.current_scenario = scenario_config
         self.start_time = datetime.now(timezone.utc)
+        self._start_monotonic = time.monotonic()
         self.current_step = 0
         
         # Reset tracking data
+        self._pending_events.clear()
         self.agent_responses.clear()
+        self._total_responses = 0
         self.scenario_events.clear()
+        self._event_type_counts.clear()
+        self._recent_events.clear()
         
         # Initialize result tracking
         self.scenario_result = ScenarioResult(
@@ -536,23 +736,12 @@ class ScenarioOrchestrator:
             steps_total=len(scenario_config.steps)
         )
         
-        # Setup scenario timeout
-        if self.scenario_timeout_task:
-            self.scenario_timeout_task.cancel()
-        
-        self.scenario_timeout_task = asyncio.create_task(
-            self._scenario_timeout_handler(scenario_config.max_duration_seconds)
-        )
-        
         # Publish scenario start event
-        await self.event_bus.publish(
-            "demo.scenario.initialized",
-            json.dumps({
-                "scenario_id": scenario_config.scenario_id,
-                "scenario_type": scenario_config.scenario_type.value,
-                "name": scenario_config.name,
-                "timestamp": self.start_time.isoformat()
-            })
+        self.event_bus.publish_nowait(
+            _TOPIC_INITIALIZED,
+            _initialized_head(
+                scenario_config.scenario_id, scenario_config.scenario_type.value, scenario_config.name
+            ) + self.start_time.isoformat() + '"}'
         )
         
         self.scenario_state = ScenarioState.RUNNING
@@ -564,45 +753,56 @@ class ScenarioOrchestrator:
             raise RuntimeError("No scenario initialized for execution")
         
         self.logger.info(f"Executing scenario: {self.current_scenario.name}")
+        max_duration = self.current_scenario.max_duration_seconds
         
         try:
-            # Execute each step
-            for step_index, step in enumerate(self.current_scenario.steps):
-                if self.scenario_state != ScenarioState.RUNNING:
-                    break
-                
-                self.current_step = step_index
-                self.step_start_time = datetime.now(timezone.utc)
+            # Cancels whatever step is in flight once the scenario's time budget is spent
+            async with asyncio.timeout(max_duration) as scenario_timeout:
+                self._scenario_timeout = scenario_timeout
                 
-                # Execute step
-                step_success = await self._execute_step(step)
-                
-                if step_success:
-                    self.scenario_result.steps_completed += 1
-                else:
-                    self.logger.warning(f"Step failed: {step.step_id}")
+                # Execute each step
+                for step_index, step in enumerate(self.current_scenario.steps):
+                    if self.scenario_state != ScenarioState.RUNNING:
+                        break
+                    
+                    self.current_step = step_index
+                    self._state_dirty = True
+                    self.step_start_time = datetime.now(timezone.utc)
+                    self._step_expected = frozenset(step.expected_responses)
+                    self._step_responses = asyncio.Queue()
+                    
+                    # Execute step
+                    step_success = await self._execute_step(step)
+                    
+                    if step_success:
+                        self.scenario_result.steps_completed += 1
+                    else:
+                        self.logger.warning(f"Step failed: {step.step_id}")
+                    
+                    # Record step completion
+                    self._record_event(_StepCompletedEvent(
+                        datetime.now(timezone.utc), step.step_id, step_success, step_index
+                    ))
                 
-                # Record step completion
-                self.scenario_events.append({
-                    "type": "step_completed",
-                    "timestamp": datetime.now(timezone.utc),
-                    "step_id": step.step_id,
-                    "success": step_success,
-                    "step_index": step_index
-                })
-            
-            # Evaluate scenario success
-            success = await self._evaluate_scenario_success()
+                # Evaluate scenario success
+                success = await self._evaluate_scenario_success()
             
             # Complete scenario
             await self._complete_scenario(success)
             
             return self.scenario_result
             
+        except TimeoutError:
+            await self._fail_scenario(f"Scenario timeout after {max_duration} seconds")
+            return self.scenario_result
+            
         except Exception as e:
             self.logger.error(f"Error executing scenario: {e}")
             await self._fail_scenario(str(e))
             return self.scenario_result
+        
+        finally:
+            self._scenario_timeout = None
     
     async def _execute_step(self, step: ScenarioStep) -> bool:
         """Execute a single scenario step"""
@@ -613,36 +813,20 @@ class ScenarioOrchestrator:
             if step.delay_seconds > 0:
                 await asyncio.sleep(step.delay_seconds)
             
-            # Setup step timeout
-            if self.step_timeout_task:
-                self.step_timeout_task.cancel()
-            
-            self.step_timeout_task = asyncio.create_task(
-                self._step_timeout_handler(step.timeout_seconds, step.step_id)
-            )
-            
             # Publish step event
-            event_data = step.event_data.copy()
-            event_data.update({
-                "scenario_id": self.current_scenario.scenario_id,
-                "step_id": step.step_id,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
+            payload = self._payload_head(
+                step, scenario_id=self.current_scenario.scenario_id, step_id=step.step_id
+            ) + datetime.now(timezone.utc).isoformat() + '"}'
             
-            await self.event_bus.publish(step.event_type, json.dumps(event_data))
+            self.event_bus.publish_nowait(step.event_type, payload)
             
-            # Wait for expected responses if specified
+            # Wait for expected responses if specified; the response window opens with the publish
             if step.expected_responses:
                 responses_received = await self._wait_for_responses(step)
                 step_success = len(responses_received) >= len(step.expected_responses) * 0.8  # 80% response rate
             else:
                 step_success = True
             
-            # Cancel step timeout
-            if self.step_timeout_task:
-                self.step_timeout_task.cancel()
-                self.step_timeout_task = None
-            
             self.logger.info(f"Step completed: {step.step_id} - Success: {step_success}")
             return step_success
             
@@ -650,29 +834,52 @@ class ScenarioOrchestrator:
             self.logger.error(f"Error executing step {step.step_id}: {e}")
             return False
     
-    async def _wait_for_responses(self, step: ScenarioStep) -> List[Dict[str, Any]]:
+    def _payload_head(self, step: ScenarioStep, **fields: Any) -> str:
+        """Serialized step payload up to the timestamp value; only the timestamp changes per publish"""
+        key = (id(step), tuple(fields.items()))
+        cached = self._payload_heads.get(key)
+        # Definitions are editable per orchestrator, so rebuild when event_data no longer matches
+        if cached is None or cached[1] != step.event_data:
+            payload = {**step.event_data, **fields}
+            payload.pop("timestamp", None)
+            # The entry keeps the step alive, so its id cannot be reused by another step
+            cached = self._payload_heads[key] = (
+                step, copy.deepcopy(step.event_data), dumps(payload)[:-1] + ',"timestamp":"'
+            )
+        return cached[2]
+    
+    async def _wait_for_responses(self, step: ScenarioStep) -> List[_AgentResponseEvent]:
         """Wait for expected responses to a scenario step"""
         responses_received = []
-        timeout_time = datetime.now(timezone.utc) + timedelta(seconds=step.timeout_seconds)
-        
-        while datetime.now(timezone.utc) < timeout_time and len(responses_received) < len(step.expected_responses):
-            # Check for new responses from required agents
-            for agent_type in step.required_agents:
-                if agent_type in self.agent_responses:
-                    agent_responses = self.agent_responses[agent_type]
-                    
-                    # Find responses that occurred after step start
-                    new_responses = [
-                        resp for resp in agent_responses
-                        if resp["timestamp"] >= self.step_start_time and
-                        resp["event_type"] in step.expected_responses and
-                        resp not in responses_received
-                    ]
-                    
-                    responses_received.extend(new_responses)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + step.timeout_seconds
+        # Set views built once per step instead of list scans per response
+        expected = frozenset(step.expected_responses)
+        expected_count = len(step.expected_responses)
+        # Definitions mix AgentType members and raw strings; key on the plain agent strings
+        required_agents = frozenset(map(str, step.required_agents))
+        # Fed by _drain_events with this step's expected event types, so nothing is rescanned
+        queue = self._step_responses
+        
+        while len(responses_received) < expected_count:
+            try:
+                resp = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self._log_step_timeout(step)
+                    break
+                
+                # Sleep until the drain queues an expected response (or the step times out)
+                try:
+                    resp = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    self._log_step_timeout(step)
+                    break
             
-            # Short sleep to avoid busy waiting
-            await asyncio.sleep(0.1)
+            # Only count responses from the step's required agents
+            if resp.agent_type in required_agents and resp.event_type in expected:
+                responses_received.append(resp)
         
         return responses_received
     
@@ -682,56 +889,69 @@ class ScenarioOrchestrator:
             return False
         
         success_criteria = self.current_scenario.success_criteria
+        result = self.scenario_result
         
         # Check completion rate
-        completion_rate = self.scenario_result.steps_completed / self.scenario_result.steps_total
+        completion_rate = result.steps_completed / result.steps_total
         if completion_rate < 0.8:  # 80% completion required
             return False
         
         # Check response time if specified
         if "max_response_time" in success_criteria:
             max_allowed = success_criteria["max_response_time"]
-            scenario_duration = (datetime.now(timezone.utc) - self.start_time).total_seconds()
+            scenario_duration = time.monotonic() - self._start_monotonic
             if scenario_duration > max_allowed:
                 return False
         
         # Check required agents responded
-        if "required_agents_responded" in success_criteria:
-            required_agents = set(success_criteria["required_agents_responded"])
-            responding_agents = set(self.agent_responses.keys())
-            if not required_agents.issubset(responding_agents):
+        required_agents = success_criteria.get("required_agents_responded")
+        if required_agents is not None:
+            # Membership against the response dict itself; no key-set copies
+            if not all(agent in self.agent_responses for agent in map(str, required_agents)):
                 return False
         
         # Check coordination achieved
         if success_criteria.get("coordination_achieved", False):
-            coordination_events = [
-                event for event in self.scenario_events
-                if "coordination" in event.get("event_type", "") or
-                event.get("agent_type") == "coordinator_agent"
-            ]
-            if len(coordination_events) == 0:
+            # Any coordinator response settles it without scanning the event log
+            coordination_achieved = bool(self.agent_responses.get("coordinator_agent")) or any(
+                isinstance(event, _AgentResponseEvent) and "coordination" in event.event_type
+                for event in self.scenario_events
+            )
+            if not coordination_achieved:
                 return False
         
         return True
     
+    def _capture_records(self):
+        """Materialize recorded responses and events onto the scenario result in one pass each"""
+        # The slotted records are converted straight into the result's dict shapes; no
+        # intermediate dict(...)/list(...) copies of the live collections are taken
+        self.scenario_result.agent_responses = {
+            agent: [record.to_response_record() for record in records]
+            for agent, records in self.agent_responses.items()
+        }
+        self.scenario_result.events = [event.to_record() for event in self.scenario_events]
+    
     async def _complete_scenario(self, success: bool):
         """Complete scenario execution"""
         if not self.scenario_result:
             return
         
+        # One clock read for the result and the completion event
+        now = datetime.now(timezone.utc)
+        
         # Update result
         self.scenario_result.state = ScenarioState.COMPLETED
-        self.scenario_result.end_time = datetime.now(timezone.utc)
+        self.scenario_result.end_time = now
         self.scenario_result.duration_seconds = (
             self.scenario_result.end_time - self.scenario_result.start_time
         ).total_seconds()
         self.scenario_result.success = success
-        self.scenario_result.agent_responses = dict(self.agent_responses)
-        self.scenario_result.events = list(self.scenario_events)
+        self._capture_records()
         
         # Calculate performance metrics
         self.scenario_result.performance_metrics = {
-            "total_agent_responses": sum(len(responses) for responses in self.agent_responses.values()),
+            "total_agent_responses": self._total_responses,
             "unique_agents_responded": len(self.agent_responses),
             "total_events": len(self.scenario_events),
             "completion_rate": self.scenario_result.steps_completed / self.scenario_result.steps_total,
@@ -741,21 +961,15 @@ class ScenarioOrchestrator:
         # Update state
         self.scenario_state = ScenarioState.COMPLETED
         
-        # Cancel timeouts
-        if self.scenario_timeout_task:
-            self.scenario_timeout_task.cancel()
-        if self.step_timeout_task:
-            self.step_timeout_task.cancel()
-        
         # Publish completion event
-        await self.event_bus.publish(
-            "demo.scenario.completed",
-            json.dumps({
+        self.event_bus.publish_nowait(
+            _TOPIC_COMPLETED,
+            dumps({
                 "scenario_id": self.scenario_result.scenario_id,
                 "success": success,
                 "duration_seconds": self.scenario_result.duration_seconds,
                 "steps_completed": self.scenario_result.steps_completed,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": now.isoformat()
             })
         )
         
@@ -766,56 +980,39 @@ class ScenarioOrchestrator:
         if not self.scenario_result:
             return
         
+        # One clock read for the result and the failure event
+        now = datetime.now(timezone.utc)
+        
         # Update result
         self.scenario_result.state = ScenarioState.FAILED
-        self.scenario_result.end_time = datetime.now(timezone.utc)
+        self.scenario_result.end_time = now
         self.scenario_result.duration_seconds = (
             self.scenario_result.end_time - self.scenario_result.start_time
         ).total_seconds()
         self.scenario_result.success = False
         self.scenario_result.error_message = error_message
-        self.scenario_result.agent_responses = dict(self.agent_responses)
-        self.scenario_result.events = list(self.scenario_events)
+        self._capture_records()
         
         # Update state
         self.scenario_state = ScenarioState.FAILED
         
-        # Cancel timeouts
-        if self.scenario_timeout_task:
-            self.scenario_timeout_task.cancel()
-        if self.step_timeout_task:
-            self.step_timeout_task.cancel()
-        
         # Publish failure event
-        await self.event_bus.publish(
-            "demo.scenario.failed",
-            json.dumps({
+        self.event_bus.publish_nowait(
+            _TOPIC_FAILED,
+            dumps({
                 "scenario_id": self.scenario_result.scenario_id,
                 "error_message": error_message,
                 "duration_seconds": self.scenario_result.duration_seconds,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": now.isoformat()
             })
         )
         
         self.logger.error(f"Scenario failed: {self.current_scenario.name} - Error: {error_message}")
     
-    async def _scenario_timeout_handler(self, timeout_seconds: float):
-        """Handle scenario timeout"""
-        try:
-            await asyncio.sleep(timeout_seconds)
-            if self.scenario_state == ScenarioState.RUNNING:
-                await self._fail_scenario(f"Scenario timeout after {timeout_seconds} seconds")
-        except asyncio.CancelledError:
-            pass
-    
-    async def _step_timeout_handler(self, timeout_seconds: float, step_id: str):
-        """Handle step timeout"""
-        try:
-            await asyncio.sleep(timeout_seconds)
-            self.logger.warning(f"Step timeout: {step_id} after {timeout_seconds} seconds")
-            # Step timeout doesn't fail the entire scenario, just logs the timeout
-        except asyncio.CancelledError:
-            pass
+    def _log_step_timeout(self, step: ScenarioStep):
+        """Log a step that timed out; the scenario keeps running"""
+        self.logger.warning(f"Step timeout: {step.step_id} after {step.timeout_seconds} seconds")
+        # Step timeout doesn't fail the entire scenario, just logs the timeout
     
     async def reset_scenario(self) -> bool:
         """
@@ -831,13 +1028,8 @@ class ScenarioOrchestrator:
             self.scenario_state = ScenarioState.RESETTING
             
             # Cancel any running timeouts
-            if self.scenario_timeout_task:
-                self.scenario_timeout_task.cancel()
-                self.scenario_timeout_task = None
-            
-            if self.step_timeout_task:
-                self.step_timeout_task.cancel()
-                self.step_timeout_task = None
+            if self._scenario_timeout:
+                self._scenario_timeout.reschedule(None)
             
             # Execute cleanup steps if current scenario exists
             if self.current_scenario and self.current_scenario.cleanup_steps:
@@ -847,18 +1039,22 @@ class ScenarioOrchestrator:
             self.current_scenario = None
             self.scenario_result = None
             self.start_time = None
+            self._start_monotonic = None
             self.current_step = 0
             self.step_start_time = None
+            self._step_expected = frozenset()
+            self._step_responses = asyncio.Queue()
+            self._pending_events.clear()
             self.agent_responses.clear()
+            self._total_responses = 0
             self.scenario_events.clear()
+            self._event_type_counts.clear()
+            self._recent_events.clear()
             
             # Publish reset event
-            await self.event_bus.publish(
-                "demo.scenario.reset",
-                json.dumps({
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "status": "completed"
-                })
+            self.event_bus.publish_nowait(
+                _TOPIC_RESET,
+                f'{{"timestamp":"{datetime.now(timezone.utc).isoformat()}","status":"completed"}}'
             )
             
             # Set idle state
@@ -879,20 +1075,29 @@ class ScenarioOrchestrator:
         
         self.logger.info("Executing scenario cleanup steps...")
         
+        # Delays are cumulative: group steps by the offset they fire at, keeping definition order
+        groups: Dict[float, List[ScenarioStep]] = {}
+        offset = 0.0
         for step in self.current_scenario.cleanup_steps:
+            if step.delay_seconds > 0:
+                offset += step.delay_seconds
+            groups.setdefault(offset, []).append(step)
+        
+        await asyncio.gather(*(
+            self._publish_cleanup_group(offset, steps) for offset, steps in groups.items()
+        ))
+    
+    async def _publish_cleanup_group(self, offset: float, steps: List[ScenarioStep]):
+        """Publish cleanup steps that share a start offset, in definition order"""
+        if offset > 0:
+            await asyncio.sleep(offset)
+        
+        for step in steps:
             try:
-                # Apply delay if specified
-                if step.delay_seconds > 0:
-                    await asyncio.sleep(step.delay_seconds)
-                
                 # Publish cleanup event
-                event_data = step.event_data.copy()
-                event_data.update({
-                    "cleanup": True,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
+                payload = self._payload_head(step, cleanup=True) + datetime.now(timezone.utc).isoformat() + '"}'
                 
-                await self.event_bus.publish(step.event_type, json.dumps(event_data))
+                self.event_bus.publish_nowait(step.event_type, payload)
                 
                 self.logger.debug(f"Executed cleanup step: {step.step_id}")
                 
@@ -903,63 +1108,74 @@ class ScenarioOrchestrator:
         """
         Get current scenario state and progress information.
         
+        Snapshots are reused for up to STATE_CACHE_SECONDS while nothing has
+        changed, so pollers share one dict and must not modify it.
+        
         Returns:
             Dict containing current scenario state information
         """
+        now = time.monotonic()
+        if not self._state_dirty and now - self._state_cached_at < STATE_CACHE_SECONDS:
+            return self._state_cache
+        
+        scenario = self.current_scenario
+        current_step = self.current_step
+        
+        # Work out every value first so each nested dict is built once, already filled in
+        scenario_info = None
+        total_steps = 0
+        completion_percentage = 0.0
+        if scenario:
+            scenario_info = {
+                "scenario_id": scenario.scenario_id,
+                "name": scenario.name,
+                "type": scenario.scenario_type.value,
+                "description": scenario.description
+            }
+            total_steps = len(scenario.steps)
+            if total_steps > 0:
+                completion_percentage = current_step / total_steps * 100.0
+        
+        start_time = None
+        elapsed = 0.0
+        estimated_remaining = None
+        if self.start_time:
+            start_time = self.start_time.isoformat()
+            elapsed = now - self._start_monotonic
+            
+            # Estimate remaining time based on current progress
+            if scenario and current_step > 0:
+                estimated_remaining = elapsed / current_step * (total_steps - current_step)
+        
         state_info = {
             "state": self.scenario_state.value,
-            "current_scenario": None,
+            "current_scenario": scenario_info,
             "progress": {
-                "current_step": self.current_step,
-                "total_steps": 0,
-                "completion_percentage": 0.0
+                "current_step": current_step,
+                "total_steps": total_steps,
+                "completion_percentage": completion_percentage
             },
             "timing": {
-                "start_time": None,
-                "elapsed_seconds": 0.0,
-                "estimated_remaining_seconds": None
+                "start_time": start_time,
+                "elapsed_seconds": elapsed,
+                "estimated_remaining_seconds": estimated_remaining
             },
             "agent_responses": {
-                "total_responses": sum(len(responses) for responses in self.agent_responses.values()),
-                "responding_agents": list(self.agent_responses.keys()),
+                "total_responses": self._total_responses,
+                "responding_agents": list(self.agent_responses),
                 "response_count_by_agent": {
                     agent: len(responses) for agent, responses in self.agent_responses.items()
                 }
             },
             "events": {
                 "total_events": len(self.scenario_events),
-                "recent_events": self.scenario_events[-5:] if self.scenario_events else []
+                "recent_events": [event.to_record() for event in self._recent_events]
             }
         }
         
-        # Add current scenario information
-        if self.current_scenario:
-            state_info["current_scenario"] = {
-                "scenario_id": self.current_scenario.scenario_id,
-                "name": self.current_scenario.name,
-                "type": self.current_scenario.scenario_type.value,
-                "description": self.current_scenario.description
-            }
-            
-            # Update progress information
-            state_info["progress"]["total_steps"] = len(self.current_scenario.steps)
-            if len(self.current_scenario.steps) > 0:
-                state_info["progress"]["completion_percentage"] = (
-                    self.current_step / len(self.current_scenario.steps) * 100.0
-                )
-        
-        # Add timing information
-        if self.start_time:
-            elapsed = (datetime.now(timezone.utc) - self.start_time).total_seconds()
-            state_info["timing"]["start_time"] = self.start_time.isoformat()
-            state_info["timing"]["elapsed_seconds"] = elapsed
-            
-            # Estimate remaining time based on current progress
-            if self.current_scenario and self.current_step > 0:
-                avg_step_time = elapsed / self.current_step
-                remaining_steps = len(self.current_scenario.steps) - self.current_step
-                state_info["timing"]["estimated_remaining_seconds"] = avg_step_time * remaining_steps
-        
+        self._state_cache = state_info
+        self._state_cached_at = now
+        self._state_dirty = False
         return state_info
     
     def get_available_scenarios(self) -> List[Dict[str, Any]]:
@@ -979,9 +1195,10 @@ class ScenarioOrchestrator:
                 "description": config.description,
                 "max_duration_seconds": config.max_duration_seconds,
                 "total_steps": len(config.steps),
-                "required_agents": list(set(
-                    agent for step in config.steps for agent in step.required_agents
-                ))
+                # Plain strings in a stable order; definitions mix AgentType members and raw strings
+                "required_agents": sorted({
+                    str(agent) for step in config.steps for agent in step.required_agents
+                })
             })
         
         return scenarios
@@ -995,6 +1212,16 @@ class ScenarioOrchestrator:
         """
         return self.scenario_result
     
+    def _publish_progress(self, topic: str, timestamp: datetime):
+        """Publish a pause/resume/stop event; the three share one payload shape"""
+        # Fixed shape, so format it directly; only the scenario id needs JSON escaping
+        scenario_id = dumps(self.current_scenario.scenario_id if self.current_scenario else None)
+        self.event_bus.publish_nowait(
+            topic,
+            f'{{"scenario_id":{scenario_id},"current_step":{self.current_step},'
+            f'"timestamp":"{timestamp.isoformat()}"}}'
+        )
+    
     async def pause_scenario(self) -> bool:
         """
         Pause the currently running scenario.
@@ -1008,21 +1235,12 @@ class ScenarioOrchestrator:
         try:
             self.scenario_state = ScenarioState.PAUSED
             
-            # Cancel timeouts while paused
-            if self.scenario_timeout_task:
-                self.scenario_timeout_task.cancel()
-            if self.step_timeout_task:
-                self.step_timeout_task.cancel()
+            # Suspend timeouts while paused
+            if self._scenario_timeout:
+                self._scenario_timeout.reschedule(None)
             
             # Publish pause event
-            await self.event_bus.publish(
-                "demo.scenario.paused",
-                json.dumps({
-                    "scenario_id": self.current_scenario.scenario_id if self.current_scenario else None,
-                    "current_step": self.current_step,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
-            )
+            self._publish_progress(_TOPIC_PAUSED, datetime.now(timezone.utc))
             
             self.logger.info("Scenario paused")
             return True
@@ -1044,27 +1262,14 @@ class ScenarioOrchestrator:
         try:
             self.scenario_state = ScenarioState.RUNNING
             
-            # Restart timeouts
-            if self.current_scenario:
-                remaining_time = self.current_scenario.max_duration_seconds
-                if self.start_time:
-                    elapsed = (datetime.now(timezone.utc) - self.start_time).total_seconds()
-                    remaining_time = max(0, self.current_scenario.max_duration_seconds - elapsed)
-                
-                if remaining_time > 0:
-                    self.scenario_timeout_task = asyncio.create_task(
-                        self._scenario_timeout_handler(remaining_time)
-                    )
+            # Re-arm the same timeout scope; a budget already spent expires it on the next loop pass
+            if self._scenario_timeout and self.current_scenario and self.start_time:
+                elapsed = time.monotonic() - self._start_monotonic
+                remaining_time = max(0, self.current_scenario.max_duration_seconds - elapsed)
+                self._scenario_timeout.reschedule(asyncio.get_running_loop().time() + remaining_time)
             
             # Publish resume event
-            await self.event_bus.publish(
-                "demo.scenario.resumed",
-                json.dumps({
-                    "scenario_id": self.current_scenario.scenario_id if self.current_scenario else None,
-                    "current_step": self.current_step,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
-            )
+            self._publish_progress(_TOPIC_RESUMED, datetime.now(timezone.utc))
             
             self.logger.info("Scenario resumed")
             return True
@@ -1080,20 +1285,20 @@ class ScenarioOrchestrator:
         Returns:
             bool: True if stopped successfully, False otherwise
         """
-        if self.scenario_state not in [ScenarioState.RUNNING, ScenarioState.PAUSED]:
+        if self.scenario_state not in _ACTIVE_STATES:
             return False
         
         try:
             # Cancel timeouts
-            if self.scenario_timeout_task:
-                self.scenario_timeout_task.cancel()
-            if self.step_timeout_task:
-                self.step_timeout_task.cancel()
+            if self._scenario_timeout:
+                self._scenario_timeout.reschedule(None)
+            
+            now = datetime.now(timezone.utc)
             
             # Mark as completed (but not successful)
             if self.scenario_result:
                 self.scenario_result.state = ScenarioState.COMPLETED
-                self.scenario_result.end_time = datetime.now(timezone.utc)
+                self.scenario_result.end_time = now
                 self.scenario_result.duration_seconds = (
                     self.scenario_result.end_time - self.scenario_result.start_time
                 ).total_seconds()
@@ -1103,14 +1308,7 @@ class ScenarioOrchestrator:
             self.scenario_state = ScenarioState.COMPLETED
             
             # Publish stop event
-            await self.event_bus.publish(
-                "demo.scenario.stopped",
-                json.dumps({
-                    "scenario_id": self.current_scenario.scenario_id if self.current_scenario else None,
-                    "current_step": self.current_step,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
-            )
+            self._publish_progress(_TOPIC_STOPPED, now)
             
             self.logger.info("Scenario stopped")
             return True
@@ -1126,7 +1324,7 @@ class ScenarioOrchestrator:
         Returns:
             bool: True if scenario is running, False otherwise
         """
-        return self.scenario_state in [ScenarioState.RUNNING, ScenarioState.PAUSED]
+        return self.scenario_state in _ACTIVE_STATES
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """
@@ -1135,38 +1333,29 @@ class ScenarioOrchestrator:
         Returns:
             Dict containing performance metrics
         """
+        result = self.scenario_result
         metrics = {
             "current_state": self.scenario_state.value,
-            "total_scenarios_executed": 1 if self.scenario_result else 0,
-            "current_scenario_metrics": {}
+            "total_scenarios_executed": 1 if result else 0,
+            "current_scenario_metrics": result.performance_metrics if result else {}
         }
         
-        if self.scenario_result:
-            metrics["current_scenario_metrics"] = self.scenario_result.performance_metrics
-        
         if self.start_time:
-            metrics["current_execution_time"] = (datetime.now(timezone.utc) - self.start_time).total_seconds()
+            metrics["current_execution_time"] = time.monotonic() - self._start_monotonic
         
         # Add agent response statistics
         metrics["agent_statistics"] = {
-            "total_responses": sum(len(responses) for responses in self.agent_responses.values()),
+            "total_responses": self._total_responses,
             "unique_agents": len(self.agent_responses),
             "response_distribution": {
                 agent: len(responses) for agent, responses in self.agent_responses.items()
             }
         }
         
-        # Add event statistics
+        # Add event statistics; unary + drops types whose events have all been evicted
         metrics["event_statistics"] = {
             "total_events": len(self.scenario_events),
-            "event_types": {}
+            "event_types": dict(+self._event_type_counts)
         }
         
-        # Count event types
-        for event in self.scenario_events:
-            event_type = event.get("type", "unknown")
-            metrics["event_statistics"]["event_types"][event_type] = (
-                metrics["event_statistics"]["event_types"].get(event_type, 0) + 1
-            )
-        
         return metrics
\ No newline at end of file
@@ -17,13 +17,13 @@ Features:
 """
 
 import asyncio
-import json
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 
 from ..shared.event_bus import EventBus
 from ..shared.logger import logger
+from ..shared.serialization import dumps, loads
 from ..shared.schema import (
     AgentType,
     SecurityBreachEvent,
@@ -42,7 +42,104 @@ SUSPICIOUS_THRESHOLD = 2
 CRITICAL_THRESHOLD = 3
 LOCKDOWN_DURATION_SECONDS = 90
 
+# Breach response plan: (offset from breach start, step template). Templates are shared and
+# never mutated; _initialize_breach_steps copies them into per-breach runtimes.
+_STEP_TEMPLATES: Tuple[Tuple[timedelta, ScenarioStepRuntime], ...] = (
+    # Step 1: Immediate Security Assessment (0-15 seconds)
+    (timedelta(seconds=0), ScenarioStepRuntime(
+        step_id="security_assessment",
+        description="Immediate security threat assessment and access control",
+        timeout_seconds=15.0,
+        required_agents=[AgentType.SECURITY],
+        expected_responses=["security.assessment.decision"],
+        event_type="security.access.suspicious",
+        event_data={"actions": ("camera_surveillance", "access_control_check")}
+    )),
+    # Step 2: Network Security Analysis (10-30 seconds)
+    (timedelta(seconds=10), ScenarioStepRuntime(
+        step_id="network_analysis",
+        description="Network traffic analysis and anomaly detection",
+        timeout_seconds=20.0,
+        required_agents=[AgentType.NETWORK],
+        expected_responses=["network.assessment.decision"],
+        event_type="facility.network.event",
+        event_data={"actions": ("traffic_analysis", "security_scan")}
+    )),
+    # Step 3: Facility Lockdown Initiation (20-45 seconds)
+    (timedelta(seconds=20), ScenarioStepRuntime(
+        step_id="lockdown_initiation",
+        description="Facility-wide lockdown protocol activation",
+        timeout_seconds=25.0,
+        required_agents=[AgentType.SECURITY, AgentType.NETWORK],
+        expected_responses=["security.assessment.decision", "network.assessment.decision"],
+        event_type="security.lockdown.initiated",
+        event_data={"actions": ("door_lockdown", "network_isolation", "access_revocation")}
+    )),
+    # Step 4: Multi-Agent Coordination (30-60 seconds)
+    (timedelta(seconds=30), ScenarioStepRuntime(
+        step_id="coordination_response",
+        description="Coordinated response between security and network teams",
+        timeout_seconds=30.0,
+        required_agents=[AgentType.COORDINATOR],
+        expected_responses=["facility.coordination.directive"],
+        event_type="facility.coordination.scenario",
+        event_data={"actions": ("emergency_protocol_activation", "resource_allocation")}
+    )),
+    # Step 5: Breach Containment and Verification (60-90 seconds)
+    (timedelta(seconds=60), ScenarioStepRuntime(
+        step_id="containment_verification",
+        description="Breach containment and system verification",
+        timeout_seconds=30.0,
+        required_agents=[AgentType.SECURITY, AgentType.NETWORK, AgentType.COORDINATOR],
+        expected_responses=["security.assessment.decision", "network.assessment.decision", "facility.coordination.directive"],
+        event_type="security.breach.containment",
+        event_data={"actions": ("containment_verification", "system_integrity_check", "threat_elimination")}
+    )),
+)
+
+# Simulated security actions: action -> (log event, record details, log the breach location)
+_ACTION_TABLE = {
+    "camera_surveillance": ("camera_surveillance_activated", "Camera surveillance activated for breach location", True),
+    "access_control_check": ("access_control_restricted", "Access control systems verified and restricted", True),
+    "traffic_analysis": ("network_traffic_analysis_initiated", "Network traffic analysis initiated", False),
+    "security_scan": ("security_scan_completed", "Deep security scan completed", False),
+    "door_lockdown": ("facility_door_lockdown_initiated", "All facility doors locked down", False),
+    "network_isolation": ("network_isolation_activated", "Network isolation protocols activated", False),
+    "access_revocation": ("access_credentials_revoked", "All access credentials revoked", False),
+    "emergency_protocol_activation": ("emergency_protocols_activated", "Emergency protocols activated", False),
+    "resource_allocation": ("security_resources_allocated", "Security resources allocated", False),
+    "containment_verification": ("breach_containment_verified", "Breach containment verified", False),
+    "system_integrity_check": ("system_integrity_check_completed", "System integrity check completed", False),
+    "threat_elimination": ("threat_elimination_completed", "Threat elimination procedures completed", False),
+}
+
+# Actions that also bump a scenario metric
+_METRIC_ACTIONS = {
+    "door_lockdown": "lockdown_initiated",
+    "network_isolation": "network_isolations",
+}
+
+
+# (substring, agent type) in precedence order for normalizing reported agent types
+_AGENT_KEYWORDS = (
+    ("hvac", str(AgentType.HVAC)),
+    ("power", str(AgentType.POWER)),
+    ("security", str(AgentType.SECURITY)),
+    ("network", str(AgentType.NETWORK)),
+    ("coordinator", str(AgentType.COORDINATOR)),
+)
+_AGENT_TYPES = frozenset(agent_type for _, agent_type in _AGENT_KEYWORDS)
+
 
+def _normalize_agent_type(raw_agent_type: str) -> str:
+    """Map a reported agent type onto its AgentType value, passing unknown types through"""
+    # Agents normally report the canonical value, so try an exact match before the substring scan
+    if raw_agent_type in _AGENT_TYPES:
+        return raw_agent_type
+    for keyword, agent_type in _AGENT_KEYWORDS:
+        if keyword in raw_agent_type:
+            return agent_type
+    return raw_agent_type
 
 
 class SecurityBreachScenario:
@@ -69,6 +166,11 @@ class SecurityBreachScenario:
         self.coordination_events: List[Dict[str, Any]] = []
         self.security_actions_taken: List[Dict[str, Any]] = []
         
+        # Step currently waiting on responses; _handle_agent_response fills it and sets _step_ready
+        self._pending_step: Optional[ScenarioStepRuntime] = None
+        self._pending_agents: frozenset = frozenset()
+        self._step_ready = asyncio.Event()
+        
         # Performance metrics
         self.metrics = {
             "total_breaches_handled": 0,
@@ -84,18 +186,6 @@ class SecurityBreachScenario:
     
     def _setup_event_subscriptions(self):
         """Setup event bus subscriptions for security breach monitoring"""
-        # Subscribe to security events
-        self.event_bus.subscribe(
-            "security.access.suspicious", 
-            self._handle_suspicious_access
-        )
-        
-        self.event_bus.subscribe(
-            "security.breach.detected",
-            self._handle_breach_detection
-        )
-        
-        # Subscribe to agent responses
         agent_events = [
             "security.assessment.decision",
             "network.assessment.decision",
@@ -103,13 +193,18 @@ class SecurityBreachScenario:
             "facility.coordination.scenario_orchestration"
         ]
         
-        for event_type in agent_events:
-            self.event_bus.subscribe(event_type, self._handle_agent_response)
+        self.event_bus.subscribe_many({
+            # Security events
+            "security.access.suspicious": self._handle_suspicious_access,
+            "security.breach.detected": self._handle_breach_detection,
+            # Agent responses
+            **dict.fromkeys(agent_events, self._handle_agent_response)
+        })
     
     async def _handle_suspicious_access(self, message: str):
         """Handle suspicious access attempts and trigger breach if threshold exceeded"""
         try:
-            data = json.loads(message) if isinstance(message, str) else message
+            data = message if isinstance(message, dict) else loads(message)
             
             # Extract security data
             location = data.get("location", "unknown")
@@ -130,7 +225,7 @@ class SecurityBreachScenario:
     async def _handle_breach_detection(self, message: str):
         """Handle confirmed security breach detection"""
         try:
-            data = json.loads(message) if isinstance(message, str) else message
+            data = message if isinstance(message, dict) else loads(message)
             
             # Extract breach data
             location = data.get("location", "unknown")
@@ -148,10 +243,12 @@ class SecurityBreachScenario:
             self.logger.warning("Breach already active, updating severity")
             return
         
+        now = datetime.now(timezone.utc)
+        
         # Create breach event
         breach_event = SecurityBreachEvent(
             event_id=f"security_breach_{int(time.time())}",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             event_type="security.breach.detected",
             priority=EventPriority.CRITICAL,
             severity=EventSeverity.CRITICAL,
@@ -168,7 +265,7 @@ class SecurityBreachScenario:
         )
         
         self.active_breach = breach_event
-        self.start_time = datetime.now(timezone.utc)
+        self.start_time = now
         self.completion_deadline = self.start_time + timedelta(seconds=LOCKDOWN_DURATION_SECONDS)
         
         self.logger.critical(
@@ -191,10 +288,12 @@ class SecurityBreachScenario:
             self.logger.warning("Breach already active, updating with confirmed breach")
             return
         
+        now = datetime.now(timezone.utc)
+        
         # Create breach event
         breach_event = SecurityBreachEvent(
             event_id=f"confirmed_breach_{int(time.time())}",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now,
             event_type="security.breach.confirmed",
             priority=EventPriority.CRITICAL,
             severity=EventSeverity.CRITICAL,
@@ -208,7 +307,7 @@ class SecurityBreachScenario:
         )
         
         self.active_breach = breach_event
-        self.start_time = datetime.now(timezone.utc)
+        self.start_time = now
         self.completion_deadline = self.start_time + timedelta(seconds=LOCKDOWN_DURATION_SECONDS)
         
         self.logger.critical(
@@ -232,65 +331,11 @@ class SecurityBreachScenario:
         
         current_time = datetime.now(timezone.utc)
         
-        # Step 1: Immediate Security Assessment (0-15 seconds)
-        self.breach_steps.append(ScenarioStepRuntime(
-            step_id="security_assessment",
-            description="Immediate security threat assessment and access control",
-            start_time=current_time,
-            timeout_seconds=15.0,
-            required_agents=[AgentType.SECURITY],
-            expected_responses=["security.assessment.decision"],
-            event_type="security.access.suspicious",
-            event_data={"actions": ["camera_surveillance", "access_control_check"]}
-        ))
-        
-        # Step 2: Network Security Analysis (10-30 seconds)
-        self.breach_steps.append(ScenarioStepRuntime(
-            step_id="network_analysis",
-            description="Network traffic analysis and anomaly detection",
-            start_time=current_time + timedelta(seconds=10),
-            timeout_seconds=20.0,
-            required_agents=[AgentType.NETWORK],
-            expected_responses=["network.assessment.decision"],
-            event_type="facility.network.event",
-            event_data={"actions": ["traffic_analysis", "security_scan"]}
-        ))
-        
-        # Step 3: Facility Lockdown Initiation (20-45 seconds)
-        self.breach_steps.append(ScenarioStepRuntime(
-            step_id="lockdown_initiation",
-            description="Facility-wide lockdown protocol activation",
-            start_time=current_time + timedelta(seconds=20),
-            timeout_seconds=25.0,
-            required_agents=[AgentType.SECURITY, AgentType.NETWORK],
-            expected_responses=["security.assessment.decision", "network.assessment.decision"],
-            event_type="security.lockdown.initiated",
-            event_data={"actions": ["door_lockdown", "network_isolation", "access_revocation"]}
-        ))
-        
-        # Step 4: Multi-Agent Coordination (30-60 seconds)
-        self.breach_steps.append(ScenarioStepRuntime(
-            step_id="coordination_response",
-            description="Coordinated response between security and network teams",
-            start_time=current_time + timedelta(seconds=30),
-            timeout_seconds=30.0,
-            required_agents=[AgentType.COORDINATOR],
-            expected_responses=["facility.coordination.directive"],
-            event_type="facility.coordination.scenario",
-            event_data={"actions": ["emergency_protocol_activation", "resource_allocation"]}
-        ))
-        
-        # Step 5: Breach Containment and Verification (60-90 seconds)
-        self.breach_steps.append(ScenarioStepRuntime(
-            step_id="containment_verification",
-            description="Breach containment and system verification",
-            start_time=current_time + timedelta(seconds=60),
-            timeout_seconds=30.0,
-            required_agents=[AgentType.SECURITY, AgentType.NETWORK, AgentType.COORDINATOR],
-            expected_responses=["security.assessment.decision", "network.assessment.decision", "facility.coordination.directive"],
-            event_type="security.breach.containment",
-            event_data={"actions": ["containment_verification", "system_integrity_check", "threat_elimination"]}
-        ))
+        # Deep copies stamped from the shared templates, so nothing a breach touches aliases them
+        self.breach_steps = [
+            template.model_copy(deep=True, update={"start_time": current_time + offset})
+            for offset, template in _STEP_TEMPLATES
+        ]
     
     async def _execute_breach_response(self):
         """Execute the breach response steps with timing coordination"""
@@ -371,7 +416,7 @@ class SecurityBreachScenario:
         
         # Trigger events based on step type
         if step.step_id == "security_assessment":
-            await self.event_bus.publish("security.access.suspicious", json.dumps({
+            await self.event_bus.publish("security.access.suspicious", dumps({
                 **base_event_data,
                 "attempts": self.active_breach.access_attempts,
                 "suspicious_activity": True,
@@ -379,7 +424,7 @@ class SecurityBreachScenario:
             }))
         
         elif step.step_id == "network_analysis":
-            await self.event_bus.publish("facility.network.event", json.dumps({
+            await self.event_bus.publish("facility.network.event", dumps({
                 **base_event_data,
                 "event_type": "security_breach",
                 "segment": "all",
@@ -388,7 +433,7 @@ class SecurityBreachScenario:
             }))
         
         elif step.step_id == "lockdown_initiation":
-            await self.event_bus.publish("security.lockdown.initiated", json.dumps({
+            await self.event_bus.publish("security.lockdown.initiated", dumps({
                 **base_event_data,
                 "scope": "facility_wide",
                 "duration": "indefinite",
@@ -396,15 +441,16 @@ class SecurityBreachScenario:
             }))
         
         elif step.step_id == "coordination_response":
-            await self.event_bus.publish("facility.coordination.scenario", json.dumps({
+            await self.event_bus.publish("facility.coordination.scenario", dumps({
                 **base_event_data,
                 "scenario_type": "security_breach",
                 "emergency_level": "high",
-                "agent_responses": dict(self.agent_responses)
+                # Serialized right here, so no defensive copy is needed
+                "agent_responses": self.agent_responses
             }))
         
         elif step.step_id == "containment_verification":
-            await self.event_bus.publish("security.breach.containment", json.dumps({
+            await self.event_bus.publish("security.breach.containment", dumps({
                 **base_event_data,
                 "verification_required": True,
                 "system_integrity_check": True
@@ -415,127 +461,84 @@ class SecurityBreachScenario:
         if not self.active_breach:
             return
         
-        actions = step.event_data.get("actions", [])
+        actions = step.event_data.get("actions", ())
+        now = datetime.now(timezone.utc)  # actions run back to back; share one timestamp
         for action in actions:
             action_record = {
                 "action": action,
                 "step_id": step.step_id,
-                "timestamp": datetime.now(timezone.utc),
+                "timestamp": now,
                 "breach_id": self.active_breach.event_id,
                 "location": self.active_breach.location,
                 "status": "initiated"
             }
             
             # Simulate action execution
-            if action == "camera_surveillance":
-                action_record["status"] = "completed"
-                action_record["details"] = "Camera surveillance activated for breach location"
-                self.logger.info("camera_surveillance_activated", location=self.active_breach.location)
-            
-            elif action == "access_control_check":
-                action_record["status"] = "completed"
-                action_record["details"] = "Access control systems verified and restricted"
-                self.logger.info("access_control_restricted", location=self.active_breach.location)
-            
-            elif action == "traffic_analysis":
-                action_record["status"] = "completed"
-                action_record["details"] = "Network traffic analysis initiated"
-                self.logger.info("network_traffic_analysis_initiated")
-            
-            elif action == "security_scan":
-                action_record["status"] = "completed"
-                action_record["details"] = "Deep security scan completed"
-                self.logger.info("security_scan_completed")
-            
-            elif action == "door_lockdown":
-                action_record["status"] = "completed"
-                action_record["details"] = "All facility doors locked down"
-                self.logger.info("facility_door_lockdown_initiated")
-                self.metrics["lockdown_initiated"] += 1
-            
-            elif action == "network_isolation":
-                action_record["status"] = "completed"
-                action_record["details"] = "Network isolation protocols activated"
-                self.logger.info("network_isolation_activated")
-                self.metrics["network_isolations"] += 1
-            
-            elif action == "access_revocation":
-                action_record["status"] = "completed"
-                action_record["details"] = "All access credentials revoked"
-                self.logger.info("access_credentials_revoked")
-            
-            elif action == "emergency_protocol_activation":
-                action_record["status"] = "completed"
-                action_record["details"] = "Emergency protocols activated"
-                self.logger.info("emergency_protocols_activated")
-            
-            elif action == "resource_allocation":
-                action_record["status"] = "completed"
-                action_record["details"] = "Security resources allocated"
-                self.logger.info("security_resources_allocated")
-            
-            elif action == "containment_verification":
-                action_record["status"] = "completed"
-                action_record["details"] = "Breach containment verified"
-                self.logger.info("breach_containment_verified")
-            
-            elif action == "system_integrity_check":
-                action_record["status"] = "completed"
-                action_record["details"] = "System integrity check completed"
-                self.logger.info("system_integrity_check_completed")
-            
-            elif action == "threat_elimination":
+            handler = _ACTION_TABLE.get(action)
+            if handler is None:
+                self.logger.warning("unknown_security_action", action=action, step_id=step.step_id)
+            else:
+                log_event, details, log_location = handler
                 action_record["status"] = "completed"
-                action_record["details"] = "Threat elimination procedures completed"
-                self.logger.info("threat_elimination_completed")
+                action_record["details"] = details
+                if log_location:
+                    self.logger.info(log_event, location=self.active_breach.location)
+                else:
+                    self.logger.info(log_event)
+                
+                metric = _METRIC_ACTIONS.get(action)
+                if metric:
+                    self.metrics[metric] += 1
             
             self.security_actions_taken.append(action_record)
     
     async def _wait_for_step_responses(self, step: ScenarioStepRuntime, deadline: datetime):
         """Wait for agent responses to a breach step"""
-        while datetime.now(timezone.utc) < deadline and len(step.agent_responses) < len(step.required_agents):
-            # Check for new responses
-            for agent_type in step.required_agents:
-                agent_key = str(agent_type)
-                if agent_key in self.agent_responses:
-                    # Find responses that occurred after step start
-                    recent_responses = [
-                        resp for resp in self.agent_responses[agent_key]
-                        if resp.get("timestamp", 0) >= step.start_time.timestamp() and
-                        agent_key not in step.agent_responses
-                    ]
-                    
-                    if recent_responses:
-                        step.agent_responses[agent_key] = recent_responses[-1]  # Latest response
-            
-            await asyncio.sleep(0.1)  # Short polling interval
+        # Pick up responses that arrived after the step started but before we began waiting
+        step_start = step.start_time.timestamp()
+        for agent_type in step.required_agents:
+            agent_key = str(agent_type)
+            if agent_key in self.agent_responses and agent_key not in step.agent_responses:
+                recent_responses = [
+                    resp for resp in self.agent_responses[agent_key]
+                    if resp.get("timestamp", 0) >= step_start
+                ]
+                
+                if recent_responses:
+                    step.agent_responses[agent_key] = recent_responses[-1]  # Latest response
+        
+        if len(step.agent_responses) >= len(step.required_agents):
+            return
+        
+        remaining = (deadline - datetime.now(timezone.utc)).total_seconds()
+        if remaining <= 0:
+            return
+        
+        # Sleep until _handle_agent_response reports the step complete (or the step times out)
+        self._pending_step = step
+        self._pending_agents = frozenset(map(str, step.required_agents))
+        self._step_ready.clear()
+        try:
+            await asyncio.wait_for(self._step_ready.wait(), remaining)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._pending_step = None
+            self._pending_agents = frozenset()
     
     async def _handle_agent_response(self, message: str):
         """Handle agent responses during breach"""
         try:
-            data = json.loads(message) if isinstance(message, str) else message
+            data = message if isinstance(message, dict) else loads(message)
             
             # Extract and normalize agent type
-            raw_agent_type = data.get("agent_type", "unknown_agent")
-            agent_type = "unknown_agent"
-            
-            if "hvac" in raw_agent_type:
-                agent_type = str(AgentType.HVAC)
-            elif "power" in raw_agent_type:
-                agent_type = str(AgentType.POWER)
-            elif "security" in raw_agent_type:
-                agent_type = str(AgentType.SECURITY)
-            elif "network" in raw_agent_type:
-                agent_type = str(AgentType.NETWORK)
-            elif "coordinator" in raw_agent_type:
-                agent_type = str(AgentType.COORDINATOR)
-            else:
-                agent_type = raw_agent_type
+            agent_type = _normalize_agent_type(data.get("agent_type", "unknown_agent"))
             
             # Store response with timestamp
+            now = datetime.now(timezone.utc)
             response_record = {
                 **data,
-                "received_at": datetime.now(timezone.utc),
+                "received_at": now,
                 "timestamp": time.time()
             }
             
@@ -544,11 +547,18 @@ class SecurityBreachScenario:
             
             self.agent_responses[agent_type].append(response_record)
             
+            # Hand the response straight to the step waiting on this agent
+            step = self._pending_step
+            if step is not None and agent_type in self._pending_agents:
+                step.agent_responses[agent_type] = response_record
+                if len(step.agent_responses) >= len(step.required_agents):
+                    self._step_ready.set()
+            
             # Log coordination event
             self.coordination_events.append({
                 "type": "agent_response",
                 "agent_type": agent_type,
-                "timestamp": datetime.now(timezone.utc),
+                "timestamp": now,
                 "breach_active": self.active_breach is not None,
                 "data": data
             })
@@ -651,7 +661,7 @@ class SecurityBreachScenario:
     
     async def _publish_breach_event(self, event_type: str, data: Dict[str, Any]):
         """Publish breach-related events to the event bus"""
-        await self.event_bus.publish(f"security_breach.{event_type}", json.dumps({
+        await self.event_bus.publish(f"security_breach.{event_type}", dumps({
             **data,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "scenario_type": ScenarioType.SECURITY_BREACH
@@ -715,7 +725,7 @@ class SecurityBreachScenario:
                 "test_scenario": True
             }
             
-            await self._handle_suspicious_access(json.dumps(test_data))
+            await self._handle_suspicious_access(dumps(test_data))
             return True
             
         except Exception as e:
@@ -747,7 +757,7 @@ class SecurityBreachScenario:
     async def _handle_orchestrator_event(self, message: str):
         """Handle events from the scenario orchestrator"""
         try:
-            data = json.loads(message) if isinstance(message, str) else message
+            data = message if isinstance(message, dict) else loads(message)
             
             if data.get("scenario") == "security_breach":
                 self.logger.info("orchestrator_scenario_detected", scenario="security_breach")
@@ -6,6 +6,7 @@ This module provides common utilities shared across all agents:
 - Pydantic data contracts (schema)
 - Resilience utilities (retries)
 - Custom exceptions (exceptions)
+- Event payload JSON helpers (serialization)
 """
 
 from intellicenter.shared.exceptions import (
@@ -48,6 +49,7 @@ from intellicenter.shared.schema import (
     ScenarioStep,
     ScenarioType,
 )
+from intellicenter.shared.serialization import dumps, loads
 
 __all__ = [
     # Exceptions
@@ -86,4 +88,7 @@ __all__ = [
     "ScenarioStep",
     "ScenarioConfig",
     "ScenarioResult",
+    # Serialization
+    "dumps",
+    "loads",
 ]
@@ -17,9 +17,19 @@ class EventBus:
     def subscribe(self, event_type, callback):
         self.subscribers[event_type].append(callback)
 
+    def subscribe_many(self, subscriptions):
+        # Register a whole {event_type: callback} mapping in one call
+        subscribers = self.subscribers
+        for event_type, callback in subscriptions.items():
+            subscribers[event_type].append(callback)
+
     async def publish(self, event_type, message):
         await self.message_queue.put((event_type, message))
 
+    def publish_nowait(self, event_type, message):
+        # The queue is unbounded, so publishing never has to wait; skip the coroutine round-trip
+        self.message_queue.put_nowait((event_type, message))
+
     async def _process_queue(self):
         while self.is_running:
             try:
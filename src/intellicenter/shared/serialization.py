@@ -0,0 +1,55 @@
+"""
+JSON helpers for event-bus payloads.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both paths produce the same ``str`` payloads the event bus and
+its subscribers already expect, and both serialize ``datetime`` values as
+ISO 8601 strings.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize values the stdlib encoder does not handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+    def loads(data: str | bytes) -> Any:
+        """Deserialize a JSON string or bytes payload."""
+        return orjson.loads(data)
+
+    JSONDecodeError: type[ValueError] = orjson.JSONDecodeError
+
+else:  # pragma: no cover - exercised only without orjson
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return json.dumps(obj, default=_default)
+
+    def loads(data: str | bytes) -> Any:
+        """Deserialize a JSON string or bytes payload."""
+        return json.loads(data)
+
+    JSONDecodeError = json.JSONDecodeError
+
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
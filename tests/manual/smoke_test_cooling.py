@@ -38,6 +38,7 @@ structlog.configure(
 )
 
 # Now import the modules
+from intellicenter.shared import event_loop
 from intellicenter.shared.event_bus import EventBus
 from intellicenter.shared.schema import (
     AgentDirective,
@@ -174,4 +175,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())